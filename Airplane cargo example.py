@@ -78,7 +78,9 @@ for j in range (1, len(J)):
 
 model.setParam( 'OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize ()
 
@@ -87,6 +89,8 @@ model.optimize ()
 print ('\n--------------------------------------------------------------------\n')
     
 if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
+    # solution values, read in bulk
+    x_val = model.getAttr('X', x)
     print ('Total profit : %10.2f euro' % model.objVal)
     print ('')
     print ('All decision variables:\n')
@@ -99,13 +103,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for j in J:
         s = '%8s' % compname[j]
         for i in I:
-            s = s + '%8.3f' % x[i,j].x
-        s = s + '%8.3f' % sum (x[i,j].x for i in I)    
+            s = s + '%8.3f' % x_val[i,j]
+        s = s + '%8.3f' % sum (x_val[i,j] for i in I)    
         print (s)    
 
     s = '%8s' % ''
     for i in I:
-        s = s + '%8.3f' % sum (x[i,j].x for j in J)    
+        s = s + '%8.3f' % sum (x_val[i,j] for j in J)    
     print (s)    
 
 else:
@@ -112,7 +112,9 @@ model.update()
 
 model.setParam( 'OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize()
 
@@ -146,7 +146,9 @@ model.update()
 
 model.setParam('OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize()
 
@@ -156,6 +158,11 @@ print ('\n--------------------------------------------------------------------\n
 months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"] 
 
 if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
+    # solution values, read in bulk
+    y_val = model.getAttr('X', y)
+    x_val = model.getAttr('X', x)
+    z_val = model.getAttr('X', z)
+    e_val = model.getAttr('X', e)
     print ('Total costs : %10.2f euro' % model.objVal)
     print ('')
     print ('All decision variables:\n')
@@ -170,13 +177,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for j in J:
         s = '%8s' % DemandName[j]
         for k in K:
-            s = s + '%8.3f' % y[j,k].x
-        s = s + '%8.3f' % sum(y[j,k].x for k in K)    
+            s = s + '%8.3f' % y_val[j,k]
+        s = s + '%8.3f' % sum(y_val[j,k] for k in K)    
         print (s)    
 
     s = '%8s' % ''
     for k in K:
-        s = s + '%8.3f' % sum(y[j,k].x for j in J)    
+        s = s + '%8.3f' % sum(y_val[j,k] for j in J)    
     print (s)  
 
     print("Bought materials")
@@ -189,13 +196,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for i in I:
         s = '%8s' % Steeltype[i]
         for k in K:
-            s = s + '%8.3f' % x[i,k].x
-        s = s + '%8.3f' % sum(x[i,k].x for k in K)    
+            s = s + '%8.3f' % x_val[i,k]
+        s = s + '%8.3f' % sum(x_val[i,k] for k in K)    
         print(s)    
 
     s = '%8s' % ''
     for k in K:
-        s = s + '%8.3f' % sum(x[i,k].x for i in I)    
+        s = s + '%8.3f' % sum(x_val[i,k] for i in I)    
     print(s)    
 
     print("Storage ")
@@ -208,13 +215,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for j in J:
         s = '%8s' % DemandName[j]
         for k in K:
-            s = s + '%8.3f' % z[j,k].x
-        s = s + '%8.3f' % sum(z[j,k].x for k in K)    
+            s = s + '%8.3f' % z_val[j,k]
+        s = s + '%8.3f' % sum(z_val[j,k] for k in K)    
         print (s)    
 
     s = '%8s' % ''
     for k in K:
-        s = s + '%8.3f' % sum(z[j,k].x for j in J)    
+        s = s + '%8.3f' % sum(z_val[j,k] for j in J)    
     print(s)   
 
     print("Electrolysis")
@@ -229,9 +236,9 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
         s = '%8s' % tekst[p]
         for k in K:
             if p == 0:
-                s = s + '%8.0f' % e[k].x
+                s = s + '%8.0f' % e_val[k]
             else:
-                ECk_value = EC + sum(ECkg * x[i,k].x * SupCuPer[i] for i in I)
+                ECk_value = EC + sum(ECkg * x_val[i,k] * SupCuPer[i] for i in I)
                 s = s + '%8.3f' % ECk_value  # Print the evaluated cost
         print(s) 
 
@@ -173,7 +173,9 @@ model.update()
 
 model.setParam( 'OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize()
 
@@ -183,15 +185,20 @@ print ('\n--------------------------------------------------------------------\n
 months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"] 
 
 if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
+    # solution values, read in bulk
+    x_val = model.getAttr('X', x)
+    z_val = model.getAttr('X', z)
+    v_val = model.getAttr('X', v)
+    y_val = model.getAttr('X', y)
     print ('Total costs : %10.2f euro.' % model.objVal)
-    total_buy_cost = sum((x[i, k].X * CostSup[i]) for i in I for k in K)  # Calculate total sum of production
+    total_buy_cost = sum((x_val[i, k] * CostSup[i]) for i in I for k in K)  # Calculate total sum of production
     print(f'Total buying costs across all products and months: {total_buy_cost:.2f} euro.')
-    total_z_cost = sum((z[j,k].X * HoldingCosts[j]) for j in J for k in K)
+    total_z_cost = sum((z_val[j,k] * HoldingCosts[j]) for j in J for k in K)
     print(f'Total buying costs across all products and months: {total_z_cost:.2f} euro.')
 
  #   for i in I:
  #       for j in J:
- #           print(i, j, v[i,j,0].X)
+ #           print(i, j, v_val[i,j,0])
 
     print ('')
     print ('All decision variables:\n')
@@ -206,13 +213,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for j in J:
         s = '%8s' % DemandName[j]
         for k in K:
-            s = s + '%8.3f' % y[j,k].x
-        s = s + '%8.3f' % sum(y[j,k].x for k in K)    
+            s = s + '%8.3f' % y_val[j,k]
+        s = s + '%8.3f' % sum(y_val[j,k] for k in K)    
         print (s)    
 
     s = '%8s' % ''
     for k in K:
-        s = s + '%8.3f' % sum(y[j,k].x for j in J)    
+        s = s + '%8.3f' % sum(y_val[j,k] for j in J)    
     print (s)  
 
     print("Bought materials")
@@ -225,13 +232,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for i in I:
         s = '%8s' % Steeltype[i]
         for k in K:
-            s = s + '%8.3f' % x[i,k].x
-        s = s + '%8.3f' % sum(x[i,k].x for k in K)    
+            s = s + '%8.3f' % x_val[i,k]
+        s = s + '%8.3f' % sum(x_val[i,k] for k in K)    
         print(s)    
 
     s = '%8s' % ''
     for k in K:
-        s = s + '%8.3f' % sum(x[i,k].x for i in I)    
+        s = s + '%8.3f' % sum(x_val[i,k] for i in I)    
     print(s)    
 
     print("Storage ")
@@ -244,13 +251,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     for j in J:
         s = '%8s' % DemandName[j]
         for k in K:
-            s = s + '%8.3f' % z[j,k].x
-        s = s + '%8.3f' % sum(z[j,k].x for k in K)    
+            s = s + '%8.3f' % z_val[j,k]
+        s = s + '%8.3f' % sum(z_val[j,k] for k in K)    
         print (s)    
 
     s = '%8s' % ''
     for k in K:
-        s = s + '%8.3f' % sum(z[j,k].x for j in J)    
+        s = s + '%8.3f' % sum(z_val[j,k] for j in J)    
     print(s)   
 
     print("Supplier material per product")
@@ -264,13 +271,13 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
         for i in I:
             s = '%8s' % DemandName[j] + Steeltype[i]
             for k in K:
-                s = s + '%8.2f' % v[i,j,k].x
-            s = s + '%8.2f' % sum(v[i,j,k].x for k in K)    
+                s = s + '%8.2f' % v_val[i,j,k]
+            s = s + '%8.2f' % sum(v_val[i,j,k] for k in K)    
             print(s)    
 
         s = '%8s' % ''
         for k in K:
-            s = s + '%8.2f' % sum(v[i,j,k].x for i in I)    
+            s = s + '%8.2f' % sum(v_val[i,j,k] for i in I)    
         print(s)   
 
 else:
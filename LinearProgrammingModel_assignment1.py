@@ -121,7 +121,9 @@ for t in T:
 
 model.setParam('OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize ()
 
@@ -130,13 +132,18 @@ model.optimize ()
 print ('\n--------------------------------------------------------------------\n')
     
 if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
+    # solution values, read in bulk
+    x_val = model.getAttr('X', x)
+    s_val = model.getAttr('X', s)
+    p_val = model.getAttr('X', p)
     print ('All decision variables:\n')
-    for v in model.getVars():
-        if v.x > 0:
-            print('%s: %g' % (v.varName, v.x))
-    x_matrix = pd.DataFrame([[x[i, t].x for t in T] for i in I], index=suppliername, columns=months)
-    s_matrix = pd.DataFrame([[s[j, t].x for t in T] for j in J], index=[f'Steel_{j}' for j in J], columns=months)
-    p_matrix = pd.DataFrame([[p[j, t].x for t in T] for j in J], index=[f'Steel_{j}' for j in J], columns=months)
+    allVars = model.getVars()
+    for name, value in zip(model.getAttr('VarName', allVars), model.getAttr('X', allVars)):
+        if value > 0:
+            print('%s: %g' % (name, value))
+    x_matrix = pd.DataFrame([[x_val[i, t] for t in T] for i in I], index=suppliername, columns=months)
+    s_matrix = pd.DataFrame([[s_val[j, t] for t in T] for j in J], index=[f'Steel_{j}' for j in J], columns=months)
+    p_matrix = pd.DataFrame([[p_val[j, t] for t in T] for j in J], index=[f'Steel_{j}' for j in J], columns=months)
 
     print("\nX matrix (Alloy supply):")
     print(x_matrix)
@@ -0,0 +1,51 @@
+# Gurobi versus open-source solvers on the same LinearProgram
+#
+# Solves generated steel LPs and cargo LPs of several sizes with every
+# backend that is available here and reports the solve time and whether the
+# objectives agree with the first backend. The last column is the backend
+# that solve(lp, 'auto') picked for the instance. Run from the repository
+# root:
+#
+#     python benchmarks/bench_backends.py
+
+import os
+import sys
+
+from gurobipy import Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan.backends import available, backends, licence_errors, solve
+from steelplan.cargo import generate_cargo
+from steelplan.generate import generate
+from steelplan.lp import cargo_lp, steel_lp
+
+instances = [
+    ('steel 5x3x12', lambda: steel_lp(generate(5, 3, 12))),
+    ('steel 50x10x52', lambda: steel_lp(generate(50, 10, 52))),
+    ('steel 200x20x365', lambda: steel_lp(generate(200, 20, 365))),
+    ('steel per grade 20x5x52', lambda: steel_lp(generate(20, 5, 52), per_grade=True)),
+    ('cargo 4x3', lambda: cargo_lp(generate_cargo(4, 3))),
+    ('cargo 500x50', lambda: cargo_lp(generate_cargo(500, 50))),
+]
+
+
+if __name__ == '__main__':
+    names = [name for name in backends if available(name)]
+    env = Env(params={'OutputFlag': 0, 'Threads': 1}) if 'gurobi' in names else None
+
+    print('%-26s %10s' % ('instance', 'cols') + ''.join('%14s' % ('%s [s]' % name) for name in names) + '  objectives agree  auto')
+    for label, make in instances:
+        lp = make()
+        results = []
+        for name in names:
+            try:
+                results.append(solve(lp, name, env=env))
+            except GurobiError as error:
+                if error.errno not in licence_errors:
+                    raise
+                results.append(error)     # over the size limit of the licence
+        solved = [r for r in results if not isinstance(r, Exception) and r.status == 'optimal']
+        agree = all(abs(r.objVal - solved[0].objVal) <= 1e-6 * max(1, abs(solved[0].objVal)) for r in solved)
+        times = ''.join('%14s' % ('failed' if isinstance(r, Exception) else '%.4f' % r.runtime if r.status == 'optimal' else r.status)
+                        for r in results)
+        print('%-26s %10d' % (label, len(lp.c)) + times + '  %-16s  %s' % (agree, solve(lp, env=env).backend))
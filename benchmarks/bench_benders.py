@@ -0,0 +1,57 @@
+# Benders decomposition versus the monolithic electrolysis MIP
+#
+# The assignment demand is repeated to longer horizons. For each horizon and
+# copper limit the linearized electrolysis model is solved as one big-M MIP
+# and with steelplan.benders.benders_electrolysis. Reported: objective and
+# wall time of both, and the number of Benders cuts. Run from the
+# repository root:
+#
+#     python benchmarks/bench_benders.py
+
+import os
+import sys
+import time
+
+from gurobipy import GRB, Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan.backends import licence_errors
+from steelplan.benders import benders_electrolysis
+from steelplan.electrolysis import build_electrolysis_model
+from bench_electrolysis import horizon_data
+
+horizons = [12, 24, 52, 104]
+limits = [0.024, 0.01]
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+
+    print('%6s %8s %12s %10s %12s %10s %8s %8s' % ('T', 'limit', 'big-M', 'time [s]', 'Benders', 'time [s]', 'opt', 'feas'))
+    for nT in horizons:
+        data = horizon_data(nT)
+        for copperLimit in limits:
+            start = time.perf_counter()
+            try:
+                model = build_electrolysis_model(data, copperLimit, env=env, linear=True)[0]
+                model.setParam('MIPGap', 0)
+                model.setParam('TimeLimit', 300)
+                model.optimize()
+                monolithic = '%12.2f' % model.objVal if model.status == GRB.OPTIMAL else '%12s' % model.status
+                model.dispose()
+            except GurobiError as error:
+                if error.errno not in licence_errors:
+                    raise
+                monolithic = '%12s' % 'failed'     # over the size limit of the licence
+            monolithicTime = time.perf_counter() - start
+
+            try:
+                result = benders_electrolysis(data, copperLimit, env=env, timeLimit=300)
+            except GurobiError as error:
+                if error.errno not in licence_errors:
+                    raise
+                print('%6d %8.3f %s %10.3f %12s' % (nT, copperLimit, monolithic, monolithicTime, 'failed'))
+                continue
+            benders = '%12.2f' % result['objVal'] if result['status'] == GRB.OPTIMAL else '%12s' % result['status']
+            print('%6d %8.3f %s %10.3f %s %10.3f %8d %8d' % (nT, copperLimit, monolithic, monolithicTime, benders,
+                                                           result['runtime'], result['cuts']['optimality'], result['cuts']['feasibility']))
@@ -0,0 +1,78 @@
+# Adaptive copper-limit search versus the fixed grid
+#
+# The grid of LinearProgrammingModel_assignment1e.py (from 0.04 down in
+# steps of 0.001) and finer grids are solved point by point with
+# steelplan.sweep.copper_sweep and adaptively with
+# steelplan.breakpoints.copper_breakpoints. Reported: the number of MIP
+# solves, total solve time, the largest relative cost difference between
+# the two curves and the number of grid points with another electrolysis
+# pattern. The rows 'no electrolysis' forbid electrolysis, so that the low
+# limits are infeasible and the boundary is found by bisection. The last
+# table locates the pattern changes and the boundary on the grid of the
+# script to within 1e-6 and reports the extra solves. Run from the
+# repository root:
+#
+#     python benchmarks/bench_breakpoints.py
+
+import os
+import sys
+
+from gurobipy import GRB, Env
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import steelplan.breakpoints
+import steelplan.sweep
+from steelplan import default_data
+from steelplan.electrolysis import build_electrolysis_model
+
+copperLimit = 0.04
+grids = [(0.001, 20), (0.001, 40), (0.0005, 80), (0.0001, 400)]
+resolution = 1e-6
+
+
+def without_electrolysis(*args, **kwargs):
+    model, vars = build_electrolysis_model(*args, **kwargs)
+    for t in vars['b']:
+        vars['b'][t].ub = 0
+    return model, vars
+
+
+def compare(data, step, reps, env, label):
+    limits = [copperLimit - k * step for k in range(reps)]
+    grid = steelplan.sweep.copper_sweep(data, limits, env=env, stop_at_infeasible=False)
+    search = steelplan.breakpoints.copper_breakpoints(data, limits, env=env)
+    adaptive = search['results']
+    both = [(g, a) for g, a in zip(grid, adaptive) if g['status'] == GRB.OPTIMAL]
+    error = max((abs(g['objVal'] - a.get('objVal', float('inf'))) / g['objVal'] for g, a in both), default=0.0)
+    patterns = sum(g['electrolysis'] != a.get('electrolysis') for g, a in both)
+    print('%-16s %8.4f %6d %8d %8d %10.3f %10.3f %10.1e %9d' % (
+        label, step, reps, len(grid), search['solves'],
+        sum(r['runtime'] for r in grid), sum(r['runtime'] for r in adaptive), error, patterns))
+
+
+def locate(data, env, label):
+    limits = [copperLimit - k * 0.001 for k in range(40)]
+    coarse = steelplan.breakpoints.copper_breakpoints(data, limits, env=env)
+    fine = steelplan.breakpoints.copper_breakpoints(data, limits, env=env, resolution=resolution)
+    print('\n%s, step 0.001, resolution %g: %d solves on the grid, %d with resolution' % (label, resolution, coarse['solves'], fine['solves']))
+    for point in fine['breakpoints']:
+        print('  pattern changes between %.6f and %.6f: %s -> %s' % (point['high'], point['low'], point['above'], point['below']))
+    if fine['boundary'] is not None:
+        print('  lowest feasible limit %.6f (grid: %.3f)' % (fine['boundary'], coarse['boundary']))
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+    data = default_data()
+
+    print('%-16s %8s %6s %8s %8s %10s %10s %10s %9s' % ('', 'step', 'points', 'grid', 'adaptive', 'grid [s]', 'adapt [s]', 'max error', 'patterns'))
+    for step, reps in grids:
+        compare(data, step, reps, env, 'electrolysis')
+    locate(data, env, 'electrolysis')
+
+    # no electrolysis: the limits below the boundary are infeasible
+    steelplan.sweep.build_electrolysis_model = without_electrolysis
+    steelplan.breakpoints.build_electrolysis_model = without_electrolysis
+    for step, reps in grids:
+        compare(data, step, reps, env, 'no electrolysis')
+    locate(data, env, 'no electrolysis')
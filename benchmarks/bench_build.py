@@ -0,0 +1,52 @@
+# Build time of the loop and matrix StainlessSteelProduction builders
+#
+# For each problem size both builders construct the model from the same
+# instance, the two models are checked to be identical (objective, bounds,
+# constraint matrix, senses and right-hand sides), and the build times are
+# printed as a table. Run from the repository root:
+#
+#     python benchmarks/bench_build.py
+
+import os
+import sys
+import time
+
+from gurobipy import Env
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import build_loop_model, build_matrix_model, default_data
+from steelplan.generate import generate
+
+sizes = [(5, 3, 12), (50, 10, 52), (100, 20, 120), (400, 60, 365)]  # suppliers, grades, periods
+
+
+def same_model(a, b):
+    va, vb = a.getVars(), b.getVars()
+    for attr in ('Obj', 'LB', 'UB', 'VType'):
+        if a.getAttr(attr, va) != b.getAttr(attr, vb):
+            return False
+    ca, cb = a.getConstrs(), b.getConstrs()
+    for attr in ('Sense', 'RHS'):
+        if a.getAttr(attr, ca) != b.getAttr(attr, cb):
+            return False
+    return a.ModelSense == b.ModelSense and (a.getA() != b.getA()).nnz == 0
+
+
+def timed(builder, data, env):
+    start = time.perf_counter()
+    model = builder(data, env=env)[0]
+    return model, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+
+    print('%8s %8s %8s %10s %10s %10s %8s %6s' % ('I', 'J', 'T', 'vars', 'loop [s]', 'matrix [s]', 'speedup', 'same'))
+    for nI, nJ, nT in sizes:
+        data = default_data() if (nI, nJ, nT) == (5, 3, 12) else generate(nI, nJ, nT)
+        loop_model, loop_time = timed(build_loop_model, data, env)
+        matrix_model, matrix_time = timed(build_matrix_model, data, env)
+        print('%8d %8d %8d %10d %10.3f %10.3f %8.1f %6s' % (nI, nJ, nT, loop_model.NumVars, loop_time, matrix_time,
+                                                        loop_time / matrix_time, same_model(loop_model, matrix_model)))
+        loop_model.dispose()
+        matrix_model.dispose()
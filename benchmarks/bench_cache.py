@@ -0,0 +1,76 @@
+# Solution cache on repeated solves with small demand edits
+#
+# Solves a sequence of plans whose demand differs by a few percent in a
+# few cells, as in a day of re-planning, once without and once through
+# steelplan.cache.SolutionCache, and repeats the sequence so that the second
+# pass hits the cache exactly. Reported per pass: wall time (build, cache
+# lookups and writes, and solves), the part of it spent in Gurobi, simplex
+# iterations and the kinds of cache hits. Times are the minimum over
+# `repeat` runs, each with a new cache directory. Run from the repository
+# root:
+#
+#     python benchmarks/bench_cache.py
+
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import replace
+
+import numpy as np
+from gurobipy import Env
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import SteelPlanningModel
+from steelplan.cache import SolutionCache
+from steelplan.generate import generate
+
+edits = 20
+repeat = 5
+
+
+def edited_demands(data, seed=0):
+    rng = np.random.default_rng(seed)
+    demands = []
+    for _ in range(edits):
+        demand = data.demand.copy()
+        cells = rng.integers(0, demand.size, size=3)
+        demand.flat[cells] *= rng.uniform(0.95, 1.0, size=3)
+        demands.append(demand)
+    return demands
+
+
+def run(data, demands, env, cache=None, **options):
+    start = time.perf_counter()
+    iterations, solveTime, hits = 0, 0.0, Counter()
+    for demand in demands:
+        model = SteelPlanningModel(replace(data, demand=demand), env=env, **options)
+        if cache is None:
+            model.optimize(background=False)
+            hits['none'] += 1
+        else:
+            hits[cache.solve(model)['hit']] += 1
+        if model.model is not None:
+            iterations += model.model.IterCount
+            solveTime += model.model.Runtime
+            model.model.dispose()
+    return time.perf_counter() - start, solveTime, iterations, hits
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+    instances = [('steel 20x5x52', generate(20, 5, 52), {}),
+                 ('per grade 8x3x52', generate(8, 3, 52), {'per_grade': True})]
+
+    print('%-18s %-10s %10s %10s %12s  hits' % ('instance', 'pass', 'time [s]', 'solve [s]', 'iterations'))
+    for label, data, options in instances:
+        demands = edited_demands(data)
+        best = {}
+        for _ in range(repeat):
+            cache = SolutionCache(tempfile.mkdtemp())
+            for name, use in (('no cache', None), ('first', cache), ('repeat', cache)):
+                result = run(data, demands, env, use, **options)
+                best[name] = min(best.get(name, result), result, key=lambda r: r[0])
+        for name, (seconds, solveTime, iterations, hits) in best.items():
+            print('%-18s %-10s %10.3f %10.3f %12d  %s' % (label, name, seconds, solveTime, iterations, dict(hits)))
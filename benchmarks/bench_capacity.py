@@ -0,0 +1,49 @@
+# Multi-scenario capacity sweep versus sequential re-solves
+#
+# For generated instances the production capacity (con3) and the supplier
+# limits (con1) are swept over a number of levels, once as scenarios of one
+# model (steelplan.capacity.capacity_sweep) and once level by level
+# (sequential_sweep). Reported: wall time of both and whether the cost
+# curves agree. Run from the repository root:
+#
+#     python benchmarks/bench_capacity.py
+
+import os
+import sys
+
+import numpy as np
+from gurobipy import Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan.backends import licence_errors
+from steelplan.capacity import capacity_sweep, sequential_sweep
+from steelplan.data import default_data
+from steelplan.generate import generate
+
+instances = [
+    ('assignment', default_data()),
+    ('steel 20x5x52', generate(20, 5, 52)),
+    ('steel 50x10x52', generate(50, 10, 52)),
+]
+counts = [10, 50]
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0, 'Threads': 1})
+
+    print('%-16s %5s %7s %14s %14s %8s  curves agree' % ('instance', 'rows', 'levels', 'scenarios [s]', 'sequential [s]', 'speedup'))
+    for label, data in instances:
+        for constraint, low, high in (('con3', 0.5 * data.maxmonth, 2 * data.maxmonth), ('con1', 0.5, 2)):
+            for count in counts:
+                levels = np.linspace(low, high, count)
+                try:
+                    scen = capacity_sweep(data, levels, constraint, env=env)
+                    seq = sequential_sweep(data, levels, constraint, env=env)
+                except GurobiError as error:
+                    if error.errno not in licence_errors:
+                        raise
+                    print('%-16s %5s %7d %14s' % (label, constraint, count, 'failed'))
+                    continue
+                agree = np.allclose(scen['objVal'], seq['objVal'], rtol=1e-6, equal_nan=True)
+                print('%-16s %5s %7d %14.3f %14.3f %7.2fx  %s' % (label, constraint, count, scen['runtime'], seq['runtime'],
+                                                                 seq['runtime'] / scen['runtime'], agree))
@@ -0,0 +1,57 @@
+# Column generation versus the full per-grade LP
+#
+# Generates supplier catalogues of growing size (5 grades, 12 periods) and
+# solves the per-grade model once with all x[i,j,t] columns
+# (build_matrix_model) and once with steelplan.colgen.column_generation.
+# Reported: wall time, number of x columns and whether the costs agree.
+# Run from the repository root:
+#
+#     python benchmarks/bench_colgen.py
+
+import os
+import sys
+import time
+
+from gurobipy import GRB, Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import build_matrix_model
+from steelplan.backends import licence_errors
+from steelplan.colgen import column_generation
+from steelplan.generate import generate
+
+catalogues = [20, 100, 1000, 10000]
+nJ, nT = 5, 12
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+
+    print('%10s %12s %10s %12s %10s %8s %10s  costs agree' % (
+        'suppliers', 'full cols', 'full [s]', 'colgen cols', 'colgen [s]', 'iters', 'speedup'))
+    for nI in catalogues:
+        data = generate(nI, nJ, nT)
+
+        start = time.perf_counter()
+        try:
+            model = build_matrix_model(data, env=env, per_grade=True)[0]
+            model.optimize()
+            full = model.objVal if model.status == GRB.OPTIMAL else None
+            model.dispose()
+        except GurobiError as error:
+            if error.errno not in licence_errors:
+                raise
+            full = None         # over the size limit of the licence
+        fullTime = time.perf_counter() - start
+
+        try:
+            result = column_generation(data, env=env)
+        except GurobiError as error:
+            if error.errno not in licence_errors:
+                raise
+            result = {'status': None, 'objVal': None, 'columns': 0, 'iterations': 0, 'runtime': float('nan')}
+
+        agree = full is not None and result['status'] == GRB.OPTIMAL and abs(result['objVal'] - full) <= 1e-6 * max(1, abs(full))
+        print('%10d %12d %10s %12d %10.3f %8d %10s  %s' % (
+            nI, nI * nJ * nT, '%.3f' % fullTime if full is not None else 'failed', result['columns'],
+            result['runtime'], result['iterations'], '%.2fx' % (fullTime / result['runtime']) if full is not None else '', agree))
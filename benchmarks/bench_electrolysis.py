@@ -0,0 +1,53 @@
+# Big-M versus tight-M versus indicator formulation of the electrolysis MIP
+#
+# The twelve months of assignment demand are repeated to longer horizons and
+# each formulation of con7 is solved at the same copper limit. Reported per
+# run: objective, branch-and-bound nodes, solve time and the number of
+# warnings (e.g. large coefficient ranges) in the Gurobi log. Run from the
+# repository root:
+#
+#     python benchmarks/bench_electrolysis.py
+
+import os
+import sys
+import tempfile
+from dataclasses import replace
+
+import numpy as np
+from gurobipy import Env
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import default_data
+from steelplan.electrolysis import build_electrolysis_model, formulations
+
+horizons = [12, 24, 52, 104]
+copperLimit = 0.024
+
+
+def horizon_data(nT):
+    data = default_data()
+    reps = -(-nT // len(data.T))
+    return replace(data, months=['t%d' % t for t in range(nT)], demand=np.tile(data.demand, reps)[:, :nT])
+
+
+def count_warnings(logfile):
+    with open(logfile) as log:
+        return sum(line.startswith('Warning') for line in log)
+
+
+if __name__ == '__main__':
+    env = Env(params={'LogToConsole': 0})
+    logfile = os.path.join(tempfile.mkdtemp(), 'gurobi.log')
+
+    print('%8s %10s %12s %10s %10s %9s' % ('T', 'formulation', 'objective', 'nodes', 'time [s]', 'warnings'))
+    for nT in horizons:
+        data = horizon_data(nT)
+        for formulation in formulations:
+            model, vars = build_electrolysis_model(data, copperLimit, env=env, formulation=formulation)
+            open(logfile, 'w').close()
+            model.setParam('LogFile', logfile)
+            model.setParam('MIPGap', 0)
+            model.setParam('TimeLimit', 300)
+            model.optimize()
+            print('%8d %10s %12.2f %10d %10.3f %9d' % (nT, formulation, model.objVal, model.NodeCount, model.Runtime, count_warnings(logfile)))
+            model.dispose()
@@ -0,0 +1,70 @@
+# Import time of the command line
+#
+# Runs python -X importtime -m steelplan for several subcommands and reports
+# the import time and the wall time of the process on top of a bare
+# interpreter (python -c pass, which already imports site, encodings, ...),
+# and whether gurobipy and pandas were imported. Times are the median of
+# `runs` runs. Exits with an error when a target is missed:
+#
+#   --help          no gurobipy, NumPy or pandas; at most help_ms of imports
+#                   more than the bare interpreter
+#   solve --json    no pandas (the machine-readable path needs no tables)
+#   cargo --json    no pandas
+#
+# Run from the repository root:
+#
+#     python benchmarks/bench_importtime.py
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+help_ms = 50
+runs = 5
+cases = [
+    (['--help'], ('gurobipy', 'numpy', 'pandas')),
+    (['solve', '--json'], ('pandas',)),
+    (['cargo', '--json'], ('pandas',)),
+    (['solve'], ()),
+]
+
+
+def importtime(args):
+    """(total import time in ms, set of imported top-level packages, wall time in ms) of python args."""
+    start = time.perf_counter()
+    err = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=root,
+                         capture_output=True, text=True, check=True).stderr
+    wall = 1000 * (time.perf_counter() - start)
+    total, packages = 0, set()
+    for line in err.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        selfus, _, name = line[len('import time:'):].split('|')
+        total += int(selfus)
+        packages.add(name.strip().split('.')[0])
+    return total / 1000, packages, wall
+
+
+def median(args):
+    results = [importtime(args) for _ in range(runs)]
+    return statistics.median(r[0] for r in results), results[0][1], statistics.median(r[2] for r in results)
+
+
+if __name__ == '__main__':
+    failures = []
+    bareImports, _, bareWall = median(['-c', 'pass'])
+    print('bare interpreter: imports %.1f ms, wall %.1f ms' % (bareImports, bareWall))
+    print('%-16s %13s %10s %9s %7s' % ('command', '+imports [ms]', '+wall [ms]', 'gurobipy', 'pandas'))
+    for args, forbidden in cases:
+        total, packages, wall = median(['-m', 'steelplan'] + args)
+        total, wall = total - bareImports, wall - bareWall
+        print('%-16s %13.1f %10.1f %9s %7s' % (' '.join(args), total, wall, 'gurobipy' in packages, 'pandas' in packages))
+        failures += ['%s imports %s' % (' '.join(args), name) for name in forbidden if name in packages]
+        if args == ['--help'] and total > help_ms:
+            failures.append('--help adds %.1f ms of imports, target %d ms' % (total, help_ms))
+
+    if failures:
+        sys.exit('import targets missed:\n  ' + '\n  '.join(failures))
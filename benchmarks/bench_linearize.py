@@ -0,0 +1,62 @@
+# Quadratic versus linearized electrolysis model
+#
+# First checks that the linearized model gives the same objective as the
+# quadratic model of the assignment1e script for every copper limit of the
+# limit from 0.040 down to 0 on the assignment data, where the electrolysis
+# pattern changes most below 0.011 (exits with an error otherwise), then
+# times both on 12, 52 and 365 period horizons. A horizon that exceeds a
+# size-limited licence is reported as failed. Run from the repository root:
+#
+#     python benchmarks/bench_linearize.py
+
+import os
+import sys
+
+from gurobipy import GRB, Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import default_data
+from steelplan.backends import licence_errors
+from steelplan.electrolysis import build_electrolysis_model
+from bench_electrolysis import horizon_data
+
+limits = [0.001 * step for step in range(40, -1, -1)]
+horizons = [12, 52, 365]
+copperLimit = 0.024
+
+
+def solve(data, copperLimit, env, linear):
+    model, vars = build_electrolysis_model(data, copperLimit, env=env, linear=linear)
+    model.setParam('MIPGap', 0)
+    model.optimize()
+    result = (model.status, model.objVal if model.status == GRB.OPTIMAL else None, model.Runtime)
+    model.dispose()
+    return result
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+
+    # ---- Regression: identical objectives on the assignment data ----
+
+    for limit in limits:
+        quadratic = solve(default_data(), limit, env, linear=False)
+        linear = solve(default_data(), limit, env, linear=True)
+        if quadratic[0] != linear[0] or (quadratic[1] is not None and abs(quadratic[1] - linear[1]) > 1e-6 * max(1, abs(quadratic[1]))):
+            sys.exit('copper limit %.3f: quadratic %s, linear %s' % (limit, quadratic[:2], linear[:2]))
+    print('linearized model matches the quadratic model for %d copper limits\n' % len(limits))
+
+    # ---- Timing ----
+
+    print('%8s %14s %14s %8s' % ('T', 'quadratic [s]', 'linear [s]', 'speedup'))
+    for nT in horizons:
+        data = horizon_data(nT)
+        try:
+            quadratic = solve(data, copperLimit, env, linear=False)
+            linear = solve(data, copperLimit, env, linear=True)
+        except GurobiError as error:
+            if error.errno not in licence_errors:
+                raise
+            print('%8d %14s %14s' % (nT, 'failed', 'failed'))
+            continue
+        print('%8d %14.3f %14.3f %8.1f' % (nT, quadratic[2], linear[2], quadratic[2] / max(linear[2], 1e-6)))
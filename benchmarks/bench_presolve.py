@@ -0,0 +1,73 @@
+# Presolve versus solving the full LP
+#
+# Builds steel LPs of several generated sizes, removes redundant rows and
+# unusable columns with steelplan.presolve, and compares solving the reduced
+# LP with solving the full LP. Both times include building the LP, the
+# first also the presolve. Times are the minimum over `repeat` runs. LPs
+# under steel_presolve's minRows are not presolved. Run from the repository
+# root:
+#
+#     python benchmarks/bench_presolve.py [backend]
+#
+# backend is one of steelplan.backends.backends (default highs).
+
+import os
+import sys
+import time
+
+from gurobipy import Env
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan.backends import solve
+from steelplan.data import default_data
+from steelplan.generate import generate
+from steelplan.lp import steel_lp
+from steelplan.presolve import steel_presolve
+
+instances = [
+    ('assignment', lambda: default_data(), False),
+    ('assignment per grade', lambda: default_data(), True),
+    ('steel 100x10x52', lambda: generate(100, 10, 52), False),
+    ('steel 1000x50x730', lambda: generate(1000, 50, 730), False),
+    ('per grade 20x5x52', lambda: generate(20, 5, 52), True),
+    ('per grade 100x10x104', lambda: generate(100, 10, 104), True),
+]
+repeat = 3
+
+
+def timed(f):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = f()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return result, best
+
+
+def solve_full(data, per_grade, backend, env):
+    lp = steel_lp(data, per_grade)
+    return lp, solve(lp, backend, env=env)
+
+
+def solve_presolved(data, per_grade, backend, env):
+    pre = steel_presolve(data, per_grade)
+    reduced = solve(pre.lp, backend, env=env)
+    return pre, reduced, pre.expand(reduced.x)
+
+
+if __name__ == '__main__':
+    backend = sys.argv[1] if len(sys.argv) > 1 else 'highs'
+    env = Env(params={'OutputFlag': 0, 'Threads': 1}) if backend == 'gurobi' else None
+
+    print('%-22s %9s %9s %9s %9s %10s %10s %8s  objectives agree' % (
+        'instance', 'rows', 'cols', '-rows', '-cols', 'full [s]', 'presol [s]', 'speedup'))
+    for label, make, per_grade in instances:
+        data = make()
+        (lp, full), fullTime = timed(lambda: solve_full(data, per_grade, backend, env))
+        (pre, reduced, x), presolvedTime = timed(lambda: solve_presolved(data, per_grade, backend, env))
+
+        agree = abs(reduced.objVal + pre.offset - full.objVal) <= 1e-6 * max(1, abs(full.objVal))
+        print('%-22s %9d %9d %9d %9d %10.4f %10.4f %7.2fx  %s' % (
+            label, lp.A.shape[0], lp.A.shape[1], pre.removed_rows, pre.removed_cols,
+            fullTime, presolvedTime, fullTime / presolvedTime, agree))
@@ -0,0 +1,92 @@
+# Rolling horizon versus full-horizon solve
+#
+# Each instance is solved once as a single LP and with rolling windows of
+# several lengths. Reported: cost, optimality gap of the rolling plan
+# against the full solve, number of window solves and wall time.
+#
+# The instances are generate() instances (20 suppliers, 5 grades) with a
+# yearly demand cycle of +-50% over 12 periods and a fiftieth of the
+# generated holding costs. With the holding costs of generate() (5 to 20
+# per kg and period, more than any price difference between suppliers)
+# buying ahead never pays and demand never exceeds capacity, so every
+# window gives the full optimum and the gap is zero by construction. The
+# assignment data (12 months) is solved as well.
+#
+# On a size-limited licence the full solve of the longer horizons fails;
+# they are then reported as failed and the windows still run. Run from the
+# repository root:
+#
+#     python benchmarks/bench_rolling.py
+
+import os
+import sys
+import time
+from dataclasses import replace
+
+import numpy as np
+from gurobipy import GRB, Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import build_matrix_model, default_data
+from steelplan.backends import licence_errors
+from steelplan.generate import generate
+from steelplan.rolling import rolling_horizon
+
+horizons = [52, 156, 730]
+windows = [1, 2, 4, 8, 26]
+nI, nJ = 20, 5
+season = 0.5
+holding = 0.02
+
+
+def seasonal(nT, seed=0):
+    data = generate(nI, nJ, nT, seed=seed)
+    cycle = 1 - season * np.sin(2 * np.pi * np.arange(nT) / 12)
+    return replace(data, demand=np.floor(data.demand * cycle), holdingcosts=data.holdingcosts * holding)
+
+
+def full_solve(data, env):
+    """Cost of the single LP over the whole horizon, None if it does not fit the licence."""
+    try:
+        model = build_matrix_model(data, env=env)[0]
+        model.optimize()
+    except GurobiError as error:
+        if error.errno not in licence_errors:
+            raise
+        return None
+    objVal = model.objVal if model.status == GRB.OPTIMAL else None
+    model.dispose()
+    return objVal
+
+
+def compare(label, data, env):
+    nT = len(data.T)
+    start = time.perf_counter()
+    full = full_solve(data, env)
+    print('%-11s %6d %8s %12s %8s %8d %10.3f' % (
+        label, nT, 'full', '%.2f' % full if full is not None else 'failed', '', 1, time.perf_counter() - start))
+
+    for window in windows:
+        if window >= nT:
+            continue
+        try:
+            result = rolling_horizon(data, window, env=env)
+        except GurobiError as error:
+            if error.errno not in licence_errors:
+                raise
+            print('%-11s %6d %8d %12s' % (label, nT, window, 'failed'))
+            continue
+        if result['status'] == GRB.OPTIMAL:
+            gap = '%8.3f' % (100 * (result['objVal'] - full) / full) if full is not None else '%8s' % ''
+            print('%-11s %6d %8d %12.2f %s %8d %10.3f' % (label, nT, window, result['objVal'], gap, result['solves'], result['runtime']))
+        else:
+            print('%-11s %6d %8d %12s %8s %8d %10.3f' % (label, nT, window, 'status %d' % result['status'], '', result['solves'], result['runtime']))
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+
+    print('%-11s %6s %8s %12s %8s %8s %10s' % ('', 'T', 'window', 'cost', 'gap [%]', 'solves', 'time [s]'))
+    compare('assignment', default_data(), env)
+    for nT in horizons:
+        compare('generated', seasonal(nT), env)
@@ -0,0 +1,47 @@
+# Two-stage stochastic planning: L-shaped versus the extensive form
+#
+# Samples 10 to 1000 demand scenarios around the assignment demand and
+# solves the two-stage problem with steelplan.stochastic.l_shaped, in one
+# process and across a process pool, and as one extensive-form LP.
+# Reported: objective, iterations and wall time. Run from the repository
+# root:
+#
+#     python benchmarks/bench_stochastic.py
+
+import os
+import sys
+
+from gurobipy import GRB, Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan.backends import licence_errors
+from steelplan.data import default_data
+from steelplan.stochastic import extensive_form, l_shaped, sample_demands
+
+counts = [10, 30, 100, 300, 1000]
+
+
+def run(solve):
+    try:
+        result = solve()
+    except GurobiError as error:
+        if error.errno not in licence_errors:
+            raise
+        return '%12s %6s %10s' % ('failed', '', '')
+    if result['status'] != GRB.OPTIMAL:
+        return '%12s %6s %10.3f' % (result['status'], '', result['runtime'])
+    return '%12.2f %6s %10.3f' % (result['objVal'], result.get('iterations', ''), result['runtime'])
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+    data = default_data()
+    workers = os.cpu_count()
+
+    print('%6s  %-31s %-31s %-31s' % ('', 'L-shaped, 1 process', 'L-shaped, %d workers' % workers, 'extensive form'))
+    print('%6s' % 'N' + ('  %12s %6s %10s' % ('cost', 'iters', 'time [s]')) * 3)
+    for n in counts:
+        demands = sample_demands(data, n)
+        print('%6d  %s  %s  %s' % (n, run(lambda: l_shaped(data, demands, workers=1, env=env)),
+                                   run(lambda: l_shaped(data, demands, workers=workers, env=env)),
+                                   run(lambda: extensive_form(data, demands, env=env))))
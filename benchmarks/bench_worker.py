@@ -0,0 +1,60 @@
+# Cold start versus a long-lived worker
+#
+# Cold: every request starts a new Python process (python -m
+# steelplan.worker) that imports gurobipy, starts an Env, solves and exits,
+# like running one of the scripts. Warm: one worker is started up front and
+# all requests go through its stdin/stdout. Reported: the worker startup
+# and the latency of steel and cargo requests both ways. Run from the
+# repository root:
+#
+#     python benchmarks/bench_worker.py
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+command = [sys.executable, '-m', 'steelplan.worker']
+requests = [
+    ('steel', {'model': 'steel'}),
+    ('steel 1d', {'model': 'steel', 'data': {'maxmonth': 159}}),
+    ('steel 1e', {'model': 'steel', 'options': {'electrolysis': True, 'copperLimit': 0.029}}),
+    ('cargo', {'model': 'cargo'}),
+]
+repeat = 20
+
+
+def cold(request):
+    start = time.perf_counter()
+    out = subprocess.run(command, input=json.dumps(request) + '\n', capture_output=True, text=True, cwd=root, check=True).stdout
+    answer = json.loads(out.splitlines()[1])
+    assert 'error' not in answer, answer['error']
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    worker = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=root)
+    ready = json.loads(worker.stdout.readline())
+    print('worker ready after %.3f s (Env startup %.3f s)' % (time.perf_counter() - start, ready['startup']))
+
+    print('%-10s %14s %14s %14s %14s' % ('request', 'cold p50 [ms]', 'cold max [ms]', 'warm p50 [ms]', 'warm max [ms]'))
+    for label, request in requests:
+        colds = [cold(request) for _ in range(max(3, repeat // 4))]
+        warms = []
+        for k in range(repeat):
+            start = time.perf_counter()
+            worker.stdin.write(json.dumps(dict(request, id=k)) + '\n')
+            worker.stdin.flush()
+            answer = json.loads(worker.stdout.readline())
+            warms.append(time.perf_counter() - start)
+            assert 'error' not in answer, answer['error']
+        print('%-10s %14.1f %14.1f %14.1f %14.1f' % (label, 1000 * np.median(colds), 1000 * max(colds),
+                                                      1000 * np.median(warms), 1000 * max(warms)))
+
+    worker.stdin.close()
+    worker.wait()
@@ -0,0 +1,53 @@
+# Demand file round trips
+#
+# Writes a small grades x periods demand frame in every format load_demand
+# reads, the way a user would write it (pandas to_csv/to_parquet, numpy
+# save, also in Fortran order), reads it back and compares values, grade
+# and period names, and that the array is C-contiguous. It prints one line
+# per file and exits with status 1 if any of them differ. Run from the
+# repository root:
+#
+#     python benchmarks/check_demand.py
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan.demand import load_demand
+
+frame = pd.DataFrame([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], index=['grade0', 'grade1'], columns=['t0', 't1', 't2'])
+named = frame.rename_axis('grade')
+
+
+def writers():
+    yield 'header.csv', lambda path: frame.to_csv(path), True
+    yield 'plain.csv', lambda path: np.savetxt(path, frame.to_numpy(), delimiter=','), False
+    yield 'c.npy', lambda path: np.save(path, np.ascontiguousarray(frame.to_numpy())), False
+    yield 'fortran.npy', lambda path: np.save(path, np.asfortranarray(frame.to_numpy())), False
+    yield 'int.npy', lambda path: np.save(path, frame.to_numpy().astype(int)), False
+    yield 'index.parquet', lambda path: frame.to_parquet(path), True
+    yield 'named.parquet', lambda path: named.to_parquet(path), True
+    yield 'column.parquet', lambda path: named.reset_index().to_parquet(path), True
+    yield 'noindex.parquet', lambda path: named.reset_index().to_parquet(path, index=False), True
+
+
+if __name__ == '__main__':
+    failures = 0
+    with tempfile.TemporaryDirectory() as folder:
+        for name, write, labelled in writers():
+            path = os.path.join(folder, name)
+            write(path)
+            # chunksize 1 also checks that the chunks are put together in order
+            demand, grades, periods = load_demand(path, chunksize=1)
+            ok = demand.shape == frame.shape and np.array_equal(demand, frame.to_numpy()) and demand.flags.c_contiguous
+            if labelled:
+                ok = ok and grades == list(frame.index) and periods == list(frame.columns)
+            else:
+                ok = ok and grades is None and periods is None
+            print('%-16s %-4s %s %s' % (name, 'ok' if ok else 'FAIL', demand.shape, grades))
+            failures += not ok
+    sys.exit(1 if failures else 0)
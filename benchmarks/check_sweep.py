@@ -0,0 +1,53 @@
+# Warm-started copper sweep versus fresh solves
+#
+# copper_sweep re-solves one model with changed con7 coefficients and the
+# previous solution as MIP start. This check solves the same grids of copper
+# limits, down to steps of 0.0001, with a new model per limit and compares
+# the costs, for every formulation. Whether a bad start is accepted depends
+# on the exact chain of limits, so several grids are checked. It prints the limits where they differ and exits with status
+# 1 if there are any. Run from the repository root:
+#
+#     python benchmarks/check_sweep.py
+
+import os
+import sys
+
+from gurobipy import GRB, Env
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import default_data
+from steelplan.electrolysis import build_electrolysis_model, formulations
+from steelplan.sweep import copper_sweep
+
+copperLimit = 0.04
+grids = [(0.001, 40), (0.0005, 80), (0.0001, 400)]
+tol = 1e-6
+
+
+def fresh(data, copperLimit, env, formulation):
+    model = build_electrolysis_model(data, copperLimit, env=env, formulation=formulation)[0]
+    model.setParam('MIPGap', 0)
+    model.optimize()
+    objVal = model.objVal if model.status == GRB.OPTIMAL else None
+    model.dispose()
+    return objVal
+
+
+if __name__ == '__main__':
+    env = Env(params={'OutputFlag': 0})
+    data = default_data()
+    failures = 0
+    for step, reps in grids:
+        limits = [copperLimit - k * step for k in range(reps)]
+        for formulation in formulations:
+            results = copper_sweep(data, limits, env=env, formulation=formulation)
+            wrong = 0
+            for result in results:
+                expected = fresh(data, result['copperLimit'], env, formulation)
+                objVal = result.get('objVal')
+                if (objVal is None) != (expected is None) or (expected is not None and abs(objVal - expected) > tol * abs(expected)):
+                    print('%-10s limit %.4f: sweep %s, fresh %s' % (formulation, result['copperLimit'], objVal, expected))
+                    wrong += 1
+            print('%-10s step %.4f: %d limits, %d differ' % (formulation, step, len(results), wrong))
+            failures += wrong
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,94 @@
+# Load test for the solve service
+#
+# Sends steel and cargo requests from concurrent clients to a running
+# service (--url) or, by default, to services started in this process with
+# and without micro-batching. Reported: p50 and p99 latency, throughput and
+# the number of 429 rejections. Run from the repository root:
+#
+#     python benchmarks/load_test.py [--url http://127.0.0.1:8350] [--clients 32] [--requests 1000]
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+mix = [
+    {'model': 'steel'},
+    {'model': 'steel', 'options': {'maxmonth': 159}},
+    {'model': 'steel', 'data': {'demand': (np.full((3, 12), 20.0)).tolist()}},
+    {'model': 'cargo'},
+]
+
+
+def post(url, request):
+    body = json.dumps(request).encode()
+    req = urllib.request.Request(url + '/solve', data=body, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=60) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+    except OSError as error:       # e.g. connection refused or reset
+        return type(error).__name__, None
+
+
+def load(url, clients, requests):
+    latencies, codes = [], []
+    lock = threading.Lock()
+    counter = iter(range(requests))
+
+    def client():
+        for k in counter:
+            start = time.perf_counter()
+            code, answer = post(url, dict(mix[k % len(mix)], id=k))
+            elapsed = time.perf_counter() - start
+            with lock:
+                codes.append(code)
+                if code == 200:
+                    latencies.append(elapsed)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    return np.array(latencies), codes, wall
+
+
+def report(label, latencies, codes, wall):
+    ok = len(latencies)
+    failed = len(codes) - ok - codes.count(429)
+    print('%-22s %8d %8d %8d %10.1f %10.1f %12.1f' % (label, ok, codes.count(429), failed, 1000 * np.percentile(latencies, 50),
+                                                      1000 * np.percentile(latencies, 99), ok / wall))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load test the steelplan solve service.')
+    parser.add_argument('--url', help='service to test (default: start local services with and without batching)')
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=1000)
+    args = parser.parse_args()
+
+    print('%-22s %8s %8s %8s %10s %10s %12s' % ('service', 'ok', '429', 'failed', 'p50 [ms]', 'p99 [ms]', 'solves/s'))
+    if args.url:
+        report(args.url, *load(args.url, args.clients, args.requests))
+    else:
+        from steelplan.service import SolveService, make_server
+
+        for label, batch, queueSize in (('no batching', 1, 1024), ('batch 8', 8, 1024), ('batch 8, queue 8', 8, 8)):
+            service = SolveService(batch=batch, queueSize=queueSize)
+            server = make_server(service, port=0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            report(label, *load('http://127.0.0.1:%d' % server.server_port, args.clients, args.requests))
+            server.shutdown()
+            server.server_close()
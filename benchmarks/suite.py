@@ -0,0 +1,145 @@
+# Benchmark suite with regression tracking
+#
+# Builds and solves every model variant at several generated instance sizes
+# and records build time, solve time and memory per case in a results file:
+#
+#   lp            the base LP (LinearProgrammingModel_assignment1.py)
+#   per_grade     the per-grade blending model x[i,j,t] (resit)
+#   electrolysis  the copper / electrolysis MIP (assignment1e, linearized)
+#   cargo         the airplane cargo LP
+#
+# Times are the minimum over --repeat runs. With --save-baseline the results
+# become the baseline; otherwise they are compared with the baseline and the
+# suite exits with status 1 when a case got more than --tolerance percent
+# slower (differences under --min-time seconds are ignored as noise). A case
+# that exceeds a size-limited licence is recorded as skipped, and the other
+# cases still run. Run from the repository root:
+#
+#     python benchmarks/suite.py --save-baseline      # once, on the reference version
+#     python benchmarks/suite.py                       # after a change
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from gurobipy import Env, GurobiError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from steelplan import SteelPlanningModel
+from steelplan.backends import licence_errors
+from steelplan.cargo import build_cargo_model, generate_cargo
+from steelplan.generate import generate, sizes
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+cargo_sizes = {'small': (4, 3), 'medium': (100, 20), 'large': (2000, 100)}
+
+
+def build_steel(variant, size, env):
+    options = {
+        'lp': {},
+        'per_grade': {'per_grade': True},
+        'electrolysis': {'electrolysis': True, 'copperLimit': 0.025, 'formulation': 'tightM', 'linear': True},
+    }[variant]
+    return SteelPlanningModel(generate(*sizes[size], seed=0), env=env, **options).build().model
+
+
+def build_cargo(variant, size, env):
+    return build_cargo_model(generate_cargo(*cargo_sizes[size], seed=0), env=env)[0]
+
+
+cases = {
+    ('lp', 'small'): build_steel, ('lp', 'medium'): build_steel, ('lp', 'large'): build_steel,
+    ('per_grade', 'small'): build_steel, ('per_grade', 'medium'): build_steel,
+    ('electrolysis', 'small'): build_steel, ('electrolysis', 'medium'): build_steel,
+    ('cargo', 'small'): build_cargo, ('cargo', 'medium'): build_cargo, ('cargo', 'large'): build_cargo,
+}
+
+
+def run_case(variant, size, env, repeat):
+    build, solve, gurobi_mb = [], [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model = cases[variant, size](variant, size, env)
+        build.append(time.perf_counter() - start)
+
+        try:
+            start = time.perf_counter()
+            model.optimize()
+            solve.append(time.perf_counter() - start)
+            gurobi_mb = max(gurobi_mb, model.MaxMemUsed * 1024)
+            status, rows, cols = model.status, model.NumConstrs, model.NumVars
+        finally:
+            model.dispose()
+
+    # one more build with allocation tracing, kept out of the timings since tracing slows it down
+    tracemalloc.start()
+    cases[variant, size](variant, size, env).dispose()
+    python_mb = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    return {'variant': variant, 'size': size, 'rows': rows, 'cols': cols, 'status': status,
+            'build': min(build), 'solve': min(solve), 'peakPythonMB': python_mb, 'gurobiMaxMemMB': gurobi_mb}
+
+
+def regressions(results, baseline, tolerance, min_time):
+    """The (case, measure, baseline, now) of every time that got more than tolerance percent slower."""
+    reference = {(r['variant'], r['size']): r for r in baseline['cases']}
+    slower = []
+    for result in results['cases']:
+        base = reference.get((result['variant'], result['size']))
+        if base is None or 'skipped' in base or 'skipped' in result:
+            continue
+        for measure in ('build', 'solve'):
+            if result[measure] - base[measure] > min_time and result[measure] > base[measure] * (1 + tolerance / 100):
+                slower.append(('%s/%s' % (result['variant'], result['size']), measure, base[measure], result[measure]))
+    return slower
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the steel and cargo models and compare with a baseline.')
+    parser.add_argument('--cases', help='comma separated variants or variant/size pairs to run (default all)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=20, help='allowed slowdown in percent (default 20)')
+    parser.add_argument('--min-time', type=float, default=0.01, help='ignore slowdowns below this many seconds')
+    parser.add_argument('--results', default=os.path.join(here, 'results.json'))
+    parser.add_argument('--baseline', default=os.path.join(here, 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--threads', type=int, default=1, help='Gurobi threads, fixed so timings are comparable')
+    args = parser.parse_args()
+
+    selected = args.cases.split(',') if args.cases else None
+    env = Env(params={'OutputFlag': 0, 'Threads': args.threads})
+
+    results = {'machine': platform.node(), 'python': platform.python_version(), 'cases': []}
+    print('%-14s %-8s %10s %10s %10s %12s %12s' % ('variant', 'size', 'cols', 'build [s]', 'solve [s]', 'python [MB]', 'gurobi [MB]'))
+    for variant, size in cases:
+        if selected and variant not in selected and '%s/%s' % (variant, size) not in selected:
+            continue
+        try:
+            result = run_case(variant, size, env, args.repeat)
+        except GurobiError as error:
+            if error.errno not in licence_errors:
+                raise
+            results['cases'].append({'variant': variant, 'size': size, 'skipped': str(error)})
+            print('%-14s %-8s %10s  skipped: %s' % (variant, size, '', error))
+            continue
+        results['cases'].append(result)
+        print('%-14s %-8s %10d %10.3f %10.3f %12.1f %12.1f' % (variant, size, result['cols'], result['build'], result['solve'],
+                                                             result['peakPythonMB'], result['gurobiMaxMemMB']))
+
+    with open(args.baseline if args.save_baseline else args.results, 'w') as out:
+        json.dump(results, out, indent=1)
+
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            slower = regressions(results, json.load(f), args.tolerance, args.min_time)
+        for case, measure, before, now in slower:
+            print('REGRESSION %s %s: %.3f s -> %.3f s (+%.0f%%)' % (case, measure, before, now, 100 * (now / before - 1)))
+        if slower:
+            sys.exit(1)
+        print('no case more than %g%% slower than the baseline' % args.tolerance)
@@ -131,7 +131,9 @@ for j in range(J):
 
 model.setParam( 'OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize ()
 
@@ -144,13 +146,17 @@ if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
     print ('')
     print ('All decision variables:\n')
 
+# solution values, read in bulk
+x_val = model.getAttr('X', x)
+y_val = model.getAttr('X', y)
+
 # 1. Amount of scrap pourchased from each supplier each month
 scrap_data = {supplier[i]: [0] * T for i in range(I)}
 for i in range(I):
     for t in range(T):
         scrap_total_for_month = 0
         for j in range(J):
-            scrap_total_for_month += x[i, t, j].X
+            scrap_total_for_month += x_val[i, t, j]
         scrap_data[supplier[i]][t] = scrap_total_for_month
 
 df_scrap = pd.DataFrame(scrap_data, index=month)
@@ -164,7 +170,7 @@ print(df_scrap)
 production_data = {product[j]: [0] * T for j in range(J)}
 for j in range(J):
     for t in range(T):
-        production_data[product[j]][t] = y[j, t].X
+        production_data[product[j]][t] = y_val[j, t]
 
 df_production = pd.DataFrame(production_data, index=month)
 df_production.index.name = 'Month'
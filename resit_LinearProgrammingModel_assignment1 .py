@@ -114,7 +114,9 @@ for t in T:
 
 model.setParam('OutputFlag', True) # silencing gurobi output or not
 model.setParam ('MIPGap', 0);       # find the optimal solution
-model.write("output.lp")            # print the model in .lp format file
+exportModel = False                 # print the model in .lp format file or not
+if exportModel:
+    model.write("output.lp")
 
 model.optimize ()
 
@@ -122,24 +124,29 @@ model.optimize ()
 # --- Print results ---
 print ('\n--------------------------------------------------------------------\n')
 if model.status == GRB.Status.OPTIMAL: # If optimal solution is found
+    # solution values, read in bulk
+    x_val = model.getAttr('X', x)
+    s_val = model.getAttr('X', s)
+    p_val = model.getAttr('X', p)
     print ('All decision variables:\n')
-    for v in model.getVars():
-        if v.x > 0:
-            print('%s: %g' % (v.varName, v.x))
+    allVars = model.getVars()
+    for name, value in zip(model.getAttr('VarName', allVars), model.getAttr('X', allVars)):
+        if value > 0:
+            print('%s: %g' % (name, value))
     for i in I:
         for t in T:
-            x[i,t] = quicksum(x[i,j,t].x for j in J)
+            x[i,t] = quicksum(x_val[i,j,t] for j in J)
 
     
     x_matrix = pd.DataFrame(
-    [[round(sum(x[i, j, t].x for j in J), 2)  for t in T]for i in I],
+    [[round(sum(x_val[i, j, t] for j in J), 2)  for t in T]for i in I],
     index=suppliername,
     columns=months,
     )
-    s_matrix = pd.DataFrame([[s[j, t].x for t in T] for j in J], index=[f'Steel_{j}' for j in J], 
+    s_matrix = pd.DataFrame([[s_val[j, t] for t in T] for j in J], index=[f'Steel_{j}' for j in J], 
     columns=months
     )
-    p_matrix = pd.DataFrame([[p[j, t].x for t in T] for j in J], index=[f'Steel_{j}' for j in J], 
+    p_matrix = pd.DataFrame([[p_val[j, t] for t in T] for j in J], index=[f'Steel_{j}' for j in J], 
     columns=months
     )
 
@@ -0,0 +1,31 @@
+# Stainless steel production planning
+#
+# Importable versions of the assignment models in the scripts next to this
+# package. The names below are imported on first use, so importing the
+# package (e.g. for the command line in __main__.py) does not load
+# gurobipy, NumPy or pandas until a model is actually needed.
+
+import importlib
+
+_exports = {
+    'SteelData': 'data',
+    'default_data': 'data',
+    'build_loop_model': 'loop',
+    'build_matrix_model': 'matrix',
+    'SteelPlanningModel': 'model',
+    'variants': 'model',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    value = getattr(importlib.import_module('.' + _exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,149 @@
+# Command line
+#
+#     python -m steelplan solve [--variant assignment1d] [--demand demand.csv] [--json]
+#     python -m steelplan sweep [--start 0.04] [--step 0.001] [--reps 20] [--json]
+#     python -m steelplan cargo [--json]
+#
+# Every subcommand imports what it needs when it runs; --help does not load
+# gurobipy at all. The Gurobi log is only printed with --log. With --json the result is printed as one JSON object and
+# pandas is never imported, the tables are only built for the readable
+# report.
+
+import argparse
+import json
+import sys
+
+
+def _tolist(value):
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+
+def _env(args):
+    """A Gurobi environment that prints its log (and licence banner) only with --log."""
+    from gurobipy import Env
+
+    env = Env(empty=True)
+    env.setParam('OutputFlag', int(args.log))
+    return env.start()
+
+
+def _data(args):
+    from .data import default_data
+
+    if args.demand:
+        from .demand import with_demand
+
+        return with_demand(default_data(), args.demand)
+    return default_data()
+
+
+def solve(args):
+    from .model import SteelPlanningModel
+
+    options = {}
+    if args.maxmonth is not None:
+        options['maxmonth'] = args.maxmonth
+    if args.copper_limit is not None:
+        options['copperLimit'] = args.copper_limit
+    model = SteelPlanningModel.variant(args.variant, _data(args), env=_env(args), **options)
+    model.optimize(args.write, background=args.write is not None)
+    if model.status != 2:       # GRB.OPTIMAL
+        return _fail(args, model.status)
+
+    if args.json:
+        sol = model.solution()
+        json.dump({'variant': args.variant, 'status': model.status, 'objVal': model.objVal,
+                   'solution': {name: _tolist(value) for name, value in sol.items() if value is not None}}, sys.stdout)
+        print()
+        return 0
+    print('Objective: %g' % model.objVal)
+    for name, table in model.tables().items():
+        print('\n%s:\n%s' % (name.upper(), table))
+    if model.b is not None:
+        print('\nElectrolysis: %s' % model.solution()['b'].tolist())
+    return 0
+
+
+def sweep(args):
+    from .sweep import copper_sweep
+
+    limits = [args.start - k * args.step for k in range(args.reps)]
+    results = copper_sweep(_data(args), limits, env=_env(args), formulation=args.formulation, linear=args.linear)
+    if args.json:
+        json.dump([{name: _tolist(value) for name, value in result.items()} for result in results], sys.stdout)
+        print()
+        return 0
+    for result in results:
+        if 'objVal' in result:
+            print('copper limit %.4f: cost %.2f, electrolysis %s' % (result['copperLimit'], result['objVal'], result['electrolysis']))
+        else:
+            print('copper limit %.4f: status %d' % (result['copperLimit'], result['status']))
+    return 0
+
+
+def cargo(args):
+    from .cargo import build_cargo_model, default_cargo
+    from .solution import values
+
+    data = default_cargo()
+    model, x = build_cargo_model(data, env=_env(args))
+    model.optimize()
+    if model.status != 2:
+        return _fail(args, model.status)
+    xs = values(model, x)
+    if args.json:
+        json.dump({'status': model.status, 'objVal': model.objVal, 'x': xs.tolist()}, sys.stdout)
+        print()
+        return 0
+    print('Objective: %g' % model.objVal)
+    for i, name in enumerate(data.cargoname):
+        print('%-8s %s' % (name, '  '.join('%s %g' % (comp, xs[i, j]) for j, comp in enumerate(data.compname))))
+    return 0
+
+
+def _fail(args, status):
+    if args.json:
+        json.dump({'status': status, 'objVal': None}, sys.stdout)
+        print()
+    else:
+        print('No optimal solution (status %d)' % status, file=sys.stderr)
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m steelplan', description='Stainless steel production planning.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('solve', help='solve one variant of the steel model')
+    # the names of model.variants, repeated here so that --help does not import the model (and gurobipy)
+    p.add_argument('--variant', default='assignment1', choices=('assignment1', 'assignment1c', 'assignment1d', 'resit', 'assignment1e'))
+    p.add_argument('--maxmonth', type=float, help='production capacity per month')
+    p.add_argument('--copper-limit', type=float, help='copper limit (assignment1e)')
+    p.add_argument('--demand', help='demand file (.npy, .csv or .parquet)')
+    p.add_argument('--write', help='write the model to this file, e.g. output.mps.bz2')
+    p.add_argument('--json', action='store_true', help='print the result as JSON (no pandas)')
+    p.set_defaults(run=solve)
+
+    p = commands.add_parser('sweep', help='copper-limit sweep of the electrolysis model')
+    p.add_argument('--start', type=float, default=0.04)
+    p.add_argument('--step', type=float, default=0.001)
+    p.add_argument('--reps', type=int, default=20)
+    p.add_argument('--formulation', default='tightM', choices=('bigM', 'tightM', 'indicator'))
+    p.add_argument('--linear', action='store_true', help='linearized (MILP) electrolysis model')
+    p.add_argument('--demand', help='demand file (.npy, .csv or .parquet)')
+    p.add_argument('--json', action='store_true', help='print the results as JSON')
+    p.set_defaults(run=sweep)
+
+    p = commands.add_parser('cargo', help='solve the airplane cargo model')
+    p.add_argument('--json', action='store_true', help='print the result as JSON')
+    p.set_defaults(run=cargo)
+
+    for p in commands.choices.values():
+        p.add_argument('--log', action='store_true', help='show the Gurobi log')
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
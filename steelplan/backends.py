@@ -0,0 +1,152 @@
+# Solver backends
+#
+# solve(lp, backend) solves a LinearProgram (lp.py) with
+#
+#   'gurobi'  gurobipy, through addMVar / addMConstr
+#   'highs'   the open-source HiGHS solver through highspy
+#   'scipy'   scipy.optimize.milp, which ships its own copy of HiGHS
+#   'auto'    LPs with at most `small` columns go to HiGHS (or scipy), larger
+#             LPs and MIPs to Gurobi; if Gurobi is not installed or refuses
+#             the model (no licence, or a size-limited one), to HiGHS, then scipy
+#
+# so cheap LPs can run on machines without a Gurobi licence and the Gurobi
+# licences stay free for the big MIPs. Every backend returns a Result with
+# the same status names.
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+backends = ('gurobi', 'highs', 'scipy')
+
+# Gurobi error codes for a missing licence or a model over the licence's size limit
+licence_errors = (10009, 10010)
+
+
+@dataclass
+class Result:
+    backend: str
+    status: str         # 'optimal', 'infeasible', 'unbounded' or the solver's own status
+    objVal: float
+    x: np.ndarray       # solution vector, None without an optimal solution
+    runtime: float      # wall time of the solver call in seconds
+
+
+def row_bounds(lp):
+    lower = np.where(lp.sense == '<', -np.inf, lp.b)
+    upper = np.where(lp.sense == '>', np.inf, lp.b)
+    return lower, upper
+
+
+def solve_gurobi(lp, env=None):
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    model = gp.Model(env=env)
+    x = model.addMVar(len(lp.c), lb=lp.lb, ub=lp.ub, obj=lp.c, vtype=np.where(lp.integer, GRB.INTEGER, GRB.CONTINUOUS))
+    model.addMConstr(lp.A, x, lp.sense, lp.b)
+    model.modelSense = GRB.MAXIMIZE if lp.maximize else GRB.MINIMIZE
+
+    start = time.perf_counter()
+    model.optimize()
+    runtime = time.perf_counter() - start
+    status = {GRB.OPTIMAL: 'optimal', GRB.INFEASIBLE: 'infeasible', GRB.UNBOUNDED: 'unbounded'}.get(model.status, str(model.status))
+    result = Result('gurobi', status, model.objVal if status == 'optimal' else np.nan, x.X if status == 'optimal' else None, runtime)
+    model.dispose()
+    return result
+
+
+def solve_highs(lp, threads=None):
+    import highspy
+
+    A = lp.A.tocsc()
+    model = highspy.HighsLp()
+    model.num_col_, model.num_row_ = A.shape[1], A.shape[0]
+    model.col_cost_, model.col_lower_, model.col_upper_ = lp.c, lp.lb, lp.ub
+    model.row_lower_, model.row_upper_ = row_bounds(lp)
+    model.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    model.a_matrix_.start_, model.a_matrix_.index_, model.a_matrix_.value_ = A.indptr, A.indices, A.data
+    model.sense_ = highspy.ObjSense.kMaximize if lp.maximize else highspy.ObjSense.kMinimize
+    if lp.integer.any():
+        model.integrality_ = [highspy.HighsVarType.kInteger if i else highspy.HighsVarType.kContinuous for i in lp.integer]
+
+    highs = highspy.Highs()
+    highs.setOptionValue('output_flag', False)
+    if threads:
+        highs.setOptionValue('threads', threads)
+    highs.passModel(model)
+    start = time.perf_counter()
+    highs.run()
+    runtime = time.perf_counter() - start
+
+    status = highs.getModelStatus()
+    names = {highspy.HighsModelStatus.kOptimal: 'optimal', highspy.HighsModelStatus.kInfeasible: 'infeasible',
+             highspy.HighsModelStatus.kUnbounded: 'unbounded'}
+    status = names.get(status, highs.modelStatusToString(status))
+    if status != 'optimal':
+        return Result('highs', status, np.nan, None, runtime)
+    return Result('highs', status, highs.getInfo().objective_function_value, np.array(highs.getSolution().col_value), runtime)
+
+
+def solve_scipy(lp):
+    from scipy.optimize import Bounds, LinearConstraint, milp
+
+    sign = -1 if lp.maximize else 1
+    start = time.perf_counter()
+    res = milp(sign * lp.c, constraints=LinearConstraint(lp.A, *row_bounds(lp)), bounds=Bounds(lp.lb, lp.ub),
+               integrality=lp.integer.astype(int))
+    runtime = time.perf_counter() - start
+    status = {0: 'optimal', 2: 'infeasible', 3: 'unbounded'}.get(res.status, res.message)
+    if status != 'optimal':
+        return Result('scipy', status, np.nan, None, runtime)
+    return Result('scipy', status, sign * res.fun, res.x, runtime)
+
+
+def available(backend):
+    """Whether backend can be used here (for Gurobi: installed and a licence can be checked out)."""
+    try:
+        if backend == 'gurobi':
+            import gurobipy
+
+            gurobipy.Env(params={'OutputFlag': 0}).dispose()
+        elif backend == 'highs':
+            import highspy
+        elif backend == 'scipy':
+            from scipy.optimize import milp
+        else:
+            return False
+    except Exception:
+        return False
+    return True
+
+
+def _auto(lp, env, small):
+    order = ['highs', 'scipy', 'gurobi'] if len(lp.c) <= small and not lp.integer.any() else ['gurobi', 'highs', 'scipy']
+    for name in order:
+        if name == 'gurobi':
+            try:
+                from gurobipy import GurobiError
+            except ImportError:
+                continue
+            try:
+                return solve_gurobi(lp, env)
+            except GurobiError as error:
+                if error.errno not in licence_errors:
+                    raise
+        elif available(name):
+            return solve(lp, name)
+    raise RuntimeError('no solver available: install gurobipy, highspy or scipy')
+
+
+def solve(lp, backend='auto', env=None, small=10000):
+    """Solve a LinearProgram with the given backend; env is the Gurobi environment to use, if any."""
+    if backend == 'auto':
+        return _auto(lp, env, small)
+    if backend == 'gurobi':
+        return solve_gurobi(lp, env)
+    if backend == 'highs':
+        return solve_highs(lp)
+    if backend == 'scipy':
+        return solve_scipy(lp)
+    raise ValueError('unknown backend %r, expected auto or one of %s' % (backend, ', '.join(backends)))
@@ -0,0 +1,131 @@
+# Benders decomposition for the electrolysis MIP
+#
+# In the linearized electrolysis model (linear=True) the binaries b[t] only
+# appear in the right-hand sides once they are fixed: con7, w_bin and
+# w_cu_bin. benders_electrolysis splits the model into
+#
+#   master       min  sum_t fixed cost * b[t] + theta,  b binary
+#   subproblem   min  buying + holding + electrolysis variable cost
+#                s.t. the blending LP with right-hand side rhs0 - A_b b
+#
+# Whenever the master finds a new incumbent b, a lazy-constraint callback
+# solves the subproblem for it and adds
+#
+#   optimality cut   theta >= pi'(rhs0 - A_b b)        (pi: duals, subproblem optimal)
+#   feasibility cut  lambda'(rhs0 - A_b b) on the feasible side (lambda: Farkas dual)
+#
+# Before branching, the same cuts are added for the LP relaxation of the
+# master (b continuous) until it is solved, which gives the MIP a much
+# better bound than theta >= 0.
+#
+# The subproblem is built once from the monolithic model's matrix; only its
+# right-hand side changes between callbacks.
+
+import time
+
+import numpy as np
+from gurobipy import GRB, Model, quicksum
+
+from .electrolysis import build_electrolysis_model
+
+
+def benders_electrolysis(data, copperLimit, env=None, formulation='tightM', tol=1e-6, maxrounds=1000, timeLimit=None):
+    """Solve the linearized electrolysis MIP by Benders decomposition; returns a dict with status, objVal, b, x, s, p, cuts and runtime."""
+    if formulation == 'indicator':
+        raise ValueError('benders_electrolysis needs b[t] in the right-hand side, use formulation bigM or tightM')
+    begin = time.perf_counter()
+    nI, nJ, nT = data.shape
+
+    full, vars = build_electrolysis_model(data, copperLimit, env=env, formulation=formulation, linear=True)
+    A = full.getA().tocsc()
+    allVars = full.getVars()
+    constrs = full.getConstrs()
+    sense = np.array(full.getAttr('Sense', constrs))
+    rhs0 = np.array(full.getAttr('RHS', constrs))
+    obj = np.array(full.getAttr('Obj', allVars))
+    binary = np.array([vars['b'][t].index for t in data.T])
+    cont = np.setdiff1d(np.arange(len(allVars)), binary)
+    A_b, A_y = A[:, binary].tocsr(), A[:, cont].tocsr()
+    full.dispose()
+
+    # ---- Subproblem ----
+
+    sub = Model('StainlessSteelProductionSub', env=env)
+    sub.setParam('OutputFlag', 0)
+    sub.setParam('InfUnbdInfo', 1)
+    y = sub.addMVar(len(cont), lb=0, obj=obj[cont], name='Y')
+    subConstrs = sub.addMConstr(A_y, y, sense, rhs0, name='sub')
+    sub.update()
+
+    def solve_sub(bval):
+        subConstrs.RHS = rhs0 - A_b @ bval
+        sub.optimize()
+        return sub.status
+
+    # ---- Master ----
+
+    master = Model('StainlessSteelProductionMaster', env=env)
+    b = master.addMVar(nT, vtype=GRB.BINARY, obj=data.electrolysisFixedCost, name='ElecBin')
+    theta = master.addVar(lb=0, obj=1, name='theta')
+    master.modelSense = GRB.MINIMIZE
+    master.setParam('LazyConstraints', 1)
+    master.setParam('MIPGap', 0)
+    if timeLimit is not None:
+        master.setParam('TimeLimit', timeLimit)
+    bVars = b.tolist()
+    cuts = {'optimality': 0, 'feasibility': 0}
+
+    def cut(bval, current):
+        """The Benders cut violated by master solution bval (theta value current), or None."""
+        status = solve_sub(bval)
+        if status == GRB.OPTIMAL:
+            if current >= sub.objVal - tol * max(1.0, abs(sub.objVal)):
+                return None
+            pi = np.array(subConstrs.Pi)
+            coef = A_b.T @ pi
+            cuts['optimality'] += 1
+            return theta >= float(pi @ rhs0) - quicksum(float(c) * v for c, v in zip(coef, bVars) if c != 0)
+        if status == GRB.INFEASIBLE:
+            farkas = np.array(subConstrs.FarkasDual)
+            coef = A_b.T @ farkas
+            lhs = float(farkas @ rhs0) - quicksum(float(c) * v for c, v in zip(coef, bVars) if c != 0)
+            cuts['feasibility'] += 1
+            # bval is on one side of the certificate, every feasible b on the other
+            return lhs >= 0 if float(farkas @ (rhs0 - A_b @ bval)) < 0 else lhs <= 0
+        return None
+
+    # cuts for the LP relaxation of the master first, so the MIP starts with a good bound
+    b.VType = GRB.CONTINUOUS
+    b.UB = 1
+    for _ in range(maxrounds):
+        master.optimize()
+        if master.status != GRB.OPTIMAL:
+            break
+        relaxationCut = cut(b.X, theta.X)
+        if relaxationCut is None:
+            break
+        master.addConstr(relaxationCut)
+    b.VType = GRB.BINARY
+
+    def callback(model, where):
+        if where == GRB.Callback.MIPSOL:
+            lazyCut = cut(np.rint(model.cbGetSolution(bVars)), model.cbGetSolution(theta))
+            if lazyCut is not None:
+                model.cbLazy(lazyCut)
+
+    master.optimize(callback)
+
+    result = {'cuts': cuts, 'runtime': time.perf_counter() - begin}
+    if master.status != GRB.OPTIMAL:
+        result.update(status=master.status, objVal=np.nan)
+    else:
+        bval = np.rint(b.X)
+        solve_sub(bval)
+        yval = np.zeros(len(allVars))
+        yval[cont] = y.X
+        pick = lambda d: np.array([yval[v.index] for v in d.values()])
+        result.update(status=GRB.OPTIMAL, objVal=master.objVal, b=bval.astype(int),
+                      x=pick(vars['x']).reshape(nI, nT), s=pick(vars['s']).reshape(nJ, nT), p=pick(vars['p']).reshape(nJ, nT))
+    sub.dispose()
+    master.dispose()
+    return result
@@ -0,0 +1,128 @@
+# Adaptive copper-limit sweep
+#
+# copper_sweep solves the electrolysis MIP at every limit of a fixed grid.
+# Most of those solves add nothing: the cost is constant while the limit is
+# not binding and is often linear, or nearly so, while the electrolysis
+# pattern b[t] stays the same. copper_breakpoints takes the same grid but
+# only solves where the curve can change:
+#
+#   - the lowest feasible limit is found by bisection (a lower limit is a
+#     tighter model, so feasibility is monotone along the grid)
+#   - an interval of the grid is split at its middle point; when the middle
+#     has the same b[t] pattern as both ends and its cost lies on the line
+#     between them, the interval is taken as one linear piece and the points
+#     inside are interpolated, otherwise both halves are searched again
+#
+# With a resolution, the grid only guides the search: every change of the
+# b[t] pattern between two neighbouring grid points, and the feasibility
+# boundary, is then bisected further until it is known to within resolution.
+# Changes of the cost slope within one pattern stay at grid resolution.
+#
+# A kink whose two sides happen to cancel at the middle point is missed, as
+# with any sampling; the tolerance tol is relative to the cost.
+
+from gurobipy import GRB
+
+from .electrolysis import build_electrolysis_model
+from .sweep import solve_limit
+
+
+def copper_breakpoints(data, limits, env=None, formulation='tightM', linear=False, tol=1e-6, resolution=None):
+    """Adaptive version of copper_sweep on the grid limits (highest first).
+
+    Returns a dict with results (one per grid point, 'solved' False where
+    interpolated), breakpoints (the pattern changes, as limits low < high
+    with the patterns below and above), boundary (the lowest feasible limit
+    found, None if every limit or none is feasible) and solves, the number
+    of MIP solves.
+    """
+    limits = list(limits)
+    model, vars = build_electrolysis_model(data, limits[0], env=env, formulation=formulation, linear=linear)
+    model.setParam('MIPGap', 0)
+
+    results = {}
+    solves = [0]
+
+    def solve(copperLimit):
+        if copperLimit not in results:
+            results[copperLimit] = dict(solve_limit(model, vars, data, copperLimit), solved=True)
+            solves[0] += 1
+        return results[copperLimit]
+
+    def feasible(k):
+        return solve(limits[k])['status'] == GRB.OPTIMAL
+
+    # ---- Infeasibility boundary ----
+    last = len(limits) - 1
+    if not feasible(0):
+        last = -1
+    elif not feasible(last):
+        lo, hi = 0, last
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if feasible(mid):
+                lo = mid
+            else:
+                hi = mid
+        last = lo
+
+    # ---- Refine where slope or pattern change ----
+    intervals = [(0, last)] if last > 0 else []
+    while intervals:
+        lo, hi = intervals.pop()
+        if hi - lo < 2:
+            continue
+        mid = (lo + hi) // 2
+        a, m, c = solve(limits[lo]), solve(limits[mid]), solve(limits[hi])
+        line = a['objVal'] + (c['objVal'] - a['objVal']) * (limits[mid] - limits[lo]) / (limits[hi] - limits[lo])
+        if a['electrolysis'] == m['electrolysis'] == c['electrolysis'] and abs(m['objVal'] - line) <= tol * max(1, abs(line)):
+            continue
+        intervals += [(mid, hi), (lo, mid)]
+
+    # ---- Below grid resolution ----
+    grid = [k for k in range(last + 1) if limits[k] in results]
+    breakpoints = []
+    for k, n in zip(grid, grid[1:]):
+        high, low = limits[k], limits[n]
+        above, below = results[high]['electrolysis'], results[low]['electrolysis']
+        if above == below:
+            continue
+        while resolution is not None and high - low > resolution:
+            mid = (high + low) / 2
+            if solve(mid)['electrolysis'] == above:
+                high = mid
+            else:
+                low, below = mid, results[mid]['electrolysis']
+        breakpoints.append({'low': low, 'high': high, 'below': below, 'above': above})
+
+    boundary = None
+    if last < len(limits) - 1:
+        boundary = limits[last] if last >= 0 else None
+        if resolution is not None and last >= 0:
+            high, low = limits[last], limits[last + 1]
+            while high - low > resolution:
+                mid = (high + low) / 2
+                if solve(mid)['status'] == GRB.OPTIMAL:
+                    high = mid
+                else:
+                    low = mid
+            boundary = high
+
+    # ---- Fill the grid ----
+    out = []
+    for k, copperLimit in enumerate(limits):
+        if copperLimit in results:
+            out.append(results[copperLimit])
+        elif k > last:
+            out.append({'copperLimit': copperLimit, 'status': results[limits[last + 1]]['status'], 'runtime': 0.0, 'solved': False})
+        else:
+            lo = max(i for i in grid if i < k)
+            hi = min(i for i in grid if i > k)
+            a, c = results[limits[lo]], results[limits[hi]]
+            w = (copperLimit - limits[lo]) / (limits[hi] - limits[lo])
+            out.append({'copperLimit': copperLimit, 'status': GRB.OPTIMAL, 'runtime': 0.0, 'solved': False,
+                        'objVal': a['objVal'] + w * (c['objVal'] - a['objVal']),
+                        'electrolysis': list(a['electrolysis']),
+                        'electrolysisCost': [ea + w * (ec - ea) for ea, ec in zip(a['electrolysisCost'], c['electrolysisCost'])]})
+    model.dispose()
+    return {'results': out, 'breakpoints': breakpoints, 'boundary': boundary, 'solves': solves[0]}
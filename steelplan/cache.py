@@ -0,0 +1,193 @@
+# Solution cache
+#
+# The same plan is re-solved many times with small demand edits.
+# SolutionCache.solve(model) looks up a SteelPlanningModel before solving it:
+#
+#   exact hit   the fingerprint of all model inputs (compositions, costs,
+#               capacities, demand, initial stock and model options) is in the
+#               cache: the stored solution is returned without a solve
+#   near hit    an entry with the same inputs except demand and initial stock
+#               exists: the one with the closest demand warm-starts the solve,
+#               through VBasis/CBasis for an LP and Start for a MIP
+#   miss        a cold solve
+#
+# Every solved model is stored as one .npz file in `directory`, so the cache
+# survives restarts. The cache keeps an index in memory: the size and last
+# use of every file (read once when it is opened) and the demand of every
+# entry (read once, when its structure is first looked up). A near-hit
+# search therefore compares demands in memory and loads only the entry it
+# picks, and eviction runs only when a put takes the total over maxBytes,
+# deleting the least recently used files. Files written by other processes
+# after the cache was opened are not in the index.
+
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+from gurobipy import GRB
+
+
+def _digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            part = np.ascontiguousarray(part, dtype=float)
+            h.update(str(part.shape).encode())
+            h.update(part.tobytes())
+        else:
+            h.update(repr(part).encode())
+        h.update(b'|')
+    return h.hexdigest()
+
+
+def structure_fingerprint(model):
+    """Hash of the inputs of a SteelPlanningModel apart from demand and initial stock."""
+    data = model.data
+    return _digest(data.chromium, data.nickel, data.copper, data.maxpermonth, data.cost, data.nidist, data.chdist,
+                   data.holdingcosts, float(data.maxmonth), float(data.electrolysisFixedCost),
+                   float(data.electrolysisVariableCost), data.demand.shape, model.per_grade, model.balance, model.electrolysis,
+                   float(model.copperLimit) if model.electrolysis else None,
+                   model.formulation if model.electrolysis else None, model.linear if model.electrolysis else None)
+
+
+def fingerprint(model):
+    """Hash of all inputs of a SteelPlanningModel."""
+    return _digest(structure_fingerprint(model), model.data.demand, model.data.initialstock)
+
+
+class SolutionCache:
+    """Disk cache of solved SteelPlanningModels in directory, at most maxBytes large."""
+
+    def __init__(self, directory, maxBytes=256 * 2 ** 20):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        os.makedirs(directory, exist_ok=True)
+        # name -> [last use, size] of every entry file, and structure -> {name: demand}
+        self._files = {}
+        self._demands = {}
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.npz'):
+                stat = entry.stat()
+                self._files[entry.name] = [stat.st_mtime, stat.st_size]
+        self._total = sum(size for _, size in self._files.values())
+
+    def _name(self, structure, key):
+        return '%s-%s.npz' % (structure[:16], key[:32])
+
+    def _load(self, name, fields=None):
+        path = os.path.join(self.directory, name)
+        try:
+            with np.load(path) as entry:
+                result = {field: entry[field] for field in entry.files if fields is None or field in fields}
+            os.utime(path)
+        except (OSError, ValueError):       # evicted or half-written by another process
+            self._forget(name)
+            return None
+        self._files.setdefault(name, [0.0, os.path.getsize(path)])[0] = time.time()
+        return result
+
+    def _forget(self, name):
+        _, size = self._files.pop(name, (0.0, 0))
+        self._total -= size
+        for demands in self._demands.values():
+            demands.pop(name, None)
+
+    def _index(self, structure):
+        """name -> demand of the entries with this structure, read from disk once per entry."""
+        prefix = structure[:16] + '-'
+        demands = self._demands.setdefault(prefix, {})
+        for name in self._files:
+            if name.startswith(prefix) and name not in demands:
+                try:
+                    with np.load(os.path.join(self.directory, name)) as entry:
+                        demands[name] = entry['demand']
+                except (OSError, ValueError, KeyError):
+                    continue
+        return demands
+
+    def get(self, model):
+        """The stored entry for exactly these inputs, or None."""
+        name = self._name(structure_fingerprint(model), fingerprint(model))
+        if name not in self._files and not os.path.exists(os.path.join(self.directory, name)):
+            return None
+        return self._load(name)
+
+    def nearest(self, model):
+        """The stored entry with the same structure and the closest demand, or None."""
+        demand = model.data.demand
+        best, bestDistance = None, np.inf
+        for name, stored in self._index(structure_fingerprint(model)).items():
+            distance = np.abs(stored - demand).sum()
+            if distance < bestDistance:
+                best, bestDistance = name, distance
+        return self._load(best, ('vbasis', 'cbasis', 'start')) if best is not None else None
+
+    def put(self, model, sol):
+        """Store the solution of a solved model (with its basis or start values) and evict old entries."""
+        m = model.model
+        entry = {name: value for name, value in sol.items() if value is not None}
+        entry.update(demand=model.data.demand, objVal=m.objVal, status=m.status, start=np.array(m.getAttr('X')))
+        if not m.IsMIP:
+            try:
+                entry.update(vbasis=np.array(m.getAttr('VBasis')), cbasis=np.array(m.getAttr('CBasis')))
+            except Exception:       # no basis, e.g. barrier without crossover
+                pass
+        structure = structure_fingerprint(model)
+        name = self._name(structure, fingerprint(model))
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **entry)
+            size = f.tell()
+        os.replace(tmp, os.path.join(self.directory, name))
+
+        self._forget(name)
+        self._files[name] = [time.time(), size]
+        self._total += size
+        self._demands.setdefault(structure[:16] + '-', {})[name] = np.array(model.data.demand, dtype=float)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in maxBytes."""
+        if self._total <= self.maxBytes:
+            return
+        for name in sorted(self._files, key=lambda name: self._files[name][0]):
+            if self._total <= self.maxBytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            self._forget(name)
+
+    def solve(self, model):
+        """Solve a SteelPlanningModel through the cache; returns the solution dict with status, objVal and hit."""
+        entry = self.get(model)
+        if entry is not None:
+            sol = {name: entry.get(name) for name in ('x', 's', 'p', 'b', 'supply')}
+            sol.update(status=int(entry['status']), objVal=float(entry['objVal']), hit='exact')
+            return sol
+
+        if model.model is None:
+            model.build()
+        entry = self.nearest(model)
+        hit = 'miss'
+        if entry is not None:
+            m = model.model
+            allVars, constrs = m.getVars(), m.getConstrs()
+            if 'vbasis' in entry and len(entry['vbasis']) == len(allVars) and len(entry['cbasis']) == len(constrs):
+                m.setAttr('VBasis', allVars, entry['vbasis'].tolist())
+                m.setAttr('CBasis', constrs, entry['cbasis'].tolist())
+                hit = 'near'
+            elif len(entry['start']) == len(allVars):
+                m.setAttr('Start', allVars, entry['start'].tolist())
+                hit = 'near'
+
+        model.optimize(background=False)
+        if model.status != GRB.OPTIMAL:
+            return {'status': model.status, 'objVal': np.nan, 'hit': hit}
+        sol = model.solution()
+        self.put(model, sol)
+        sol.update(status=model.status, objVal=model.objVal, hit=hit)
+        return sol
@@ -0,0 +1,72 @@
+# Capacity sweep with Gurobi multi-scenario
+#
+# The "D" variants re-run the model with another production capacity. With
+# capacity_sweep all levels are scenarios of one model: one optimize call
+# solves them together and shares the work (presolve, bounds, incumbents)
+# between them.
+#
+#   constraint='con3'   levels are production capacities maxmonth
+#   constraint='con1'   levels are factors on every supplier limit maxpermonth
+#
+# Only the right-hand sides of those rows change per scenario (ScenNRHS).
+# sequential_sweep solves the same levels one after another on one model, as
+# the baseline.
+
+import time
+
+import numpy as np
+from gurobipy import GRB
+
+from .matrix import build_matrix_model
+
+
+def _rows(model, constraint):
+    if constraint not in ('con1', 'con3'):
+        raise ValueError("unknown constraint %r, expected 'con1' (supplier limits) or 'con3' (capacity)" % constraint)
+    return [c for c in model.getConstrs() if c.ConstrName.startswith(constraint + '[')]
+
+
+def _rhs(data, constraint, level):
+    nT = len(data.T)
+    if constraint == 'con3':
+        return np.full(nT, float(level))
+    return np.repeat(data.maxpermonth * level, nT)
+
+
+def capacity_sweep(data, levels, constraint='con3', env=None, per_grade=False):
+    """Solve all levels as scenarios of one model; returns a dict with levels, status, objVal (nan if infeasible) and runtime."""
+    start = time.perf_counter()
+    model = build_matrix_model(data, env=env, per_grade=per_grade)[0]
+    rows = _rows(model, constraint)
+    model.NumScenarios = len(levels)
+    for k, level in enumerate(levels):
+        model.params.ScenarioNumber = k
+        model.setAttr('ScenNRHS', rows, _rhs(data, constraint, level).tolist())
+    model.optimize()
+
+    objVal = np.full(len(levels), np.nan)
+    if model.status == GRB.OPTIMAL:
+        for k in range(len(levels)):
+            model.params.ScenarioNumber = k
+            if model.ScenNObjVal < GRB.INFINITY:
+                objVal[k] = model.ScenNObjVal
+    status = model.status
+    model.dispose()
+    return {'levels': np.asarray(levels, dtype=float), 'status': status, 'objVal': objVal,
+            'runtime': time.perf_counter() - start}
+
+
+def sequential_sweep(data, levels, constraint='con3', env=None, per_grade=False):
+    """The same as capacity_sweep, solving the levels one after another with warm-started re-solves."""
+    start = time.perf_counter()
+    model = build_matrix_model(data, env=env, per_grade=per_grade)[0]
+    rows = _rows(model, constraint)
+    objVal = np.full(len(levels), np.nan)
+    for k, level in enumerate(levels):
+        model.setAttr('RHS', rows, _rhs(data, constraint, level).tolist())
+        model.optimize()
+        if model.status == GRB.OPTIMAL:
+            objVal[k] = model.objVal
+    model.dispose()
+    return {'levels': np.asarray(levels, dtype=float), 'status': GRB.OPTIMAL, 'objVal': objVal,
+            'runtime': time.perf_counter() - start}
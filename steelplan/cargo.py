@@ -0,0 +1,105 @@
+# Airplane cargo example - Hillier and Lieberman ed. 10, problem 3.4-14
+#
+# The LP of "Airplane cargo example.py" as a function of its data, so it can be
+# built for generated instances and served next to the steel models: cargo
+# types i are loaded into compartments j within volume and weight capacities,
+# and every compartment is loaded in proportion to its weight capacity.
+
+from dataclasses import dataclass
+
+import numpy as np
+from gurobipy import *
+
+
+@dataclass
+class CargoData:
+    """Cargo types i (quantity in ton, volume in m3/ton, profit in euro/ton) and compartments j."""
+
+    cargoname: tuple
+    cargoquantity: np.ndarray
+    cargovolume: np.ndarray
+    cargoprofit: np.ndarray
+    compname: tuple
+    maxweight: np.ndarray
+    maxvolume: np.ndarray
+
+    def __post_init__(self):
+        for name in ('cargoquantity', 'cargovolume', 'cargoprofit', 'maxweight', 'maxvolume'):
+            setattr(self, name, np.asarray(getattr(self, name), dtype=float))
+
+    @property
+    def I(self):
+        return range(len(self.cargoname))       # set of cargo types
+
+    @property
+    def J(self):
+        return range(len(self.compname))        # set of compartments
+
+    @property
+    def shape(self):
+        return len(self.I), len(self.J)
+
+
+def default_cargo():
+    """The data of the airplane cargo example."""
+    return CargoData(
+        cargoname=('bulk_1', 'bulk_2', 'bulk_3', 'bulk_4'),
+        cargoquantity=(20, 12, 30, 11),
+        cargovolume=(500, 700, 600, 400),
+        cargoprofit=(320, 400, 360, 290),
+        compname=('front', 'center', 'back'),
+        maxweight=(12, 18, 10),
+        maxvolume=(7000, 9000, 5000),
+    )
+
+
+def generate_cargo(nI, nJ, seed=0):
+    """A random cargo instance with nI cargo types and nJ compartments (always feasible: x = 0)."""
+    rng = np.random.default_rng(seed)
+    maxweight = rng.integers(10, 20, nJ)
+    return CargoData(
+        cargoname=tuple('bulk_%d' % i for i in range(nI)),
+        cargoquantity=rng.integers(10, 31, nI),
+        cargovolume=rng.integers(400, 701, nI),
+        cargoprofit=rng.integers(280, 401, nI),
+        compname=tuple('comp_%d' % j for j in range(nJ)),
+        maxweight=maxweight,
+        maxvolume=maxweight * rng.integers(400, 550, nJ),
+    )
+
+
+def build_cargo_model(data, env=None):
+    """Build the AirplaneCargo LP; returns (model, x) with x a dict keyed by (cargo, compartment)."""
+    model = Model('AirplaneCargo', env=env)
+    I, J = data.I, data.J
+
+    # ---- Variables ----
+
+    x = {}
+    for i in I:
+        for j in J:
+            x[i,j] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, obj = data.cargoprofit[i], name = 'X[' + str(i) + ',' + str(j) + ']')
+
+    model.modelSense = GRB.MAXIMIZE
+    model.update()
+
+    # ---- Constraints ----
+
+    # Constraints 1: volume capacity
+    for j in J:
+        model.addConstr(quicksum(data.cargovolume[i] * x[i,j] for i in I) <= data.maxvolume[j], 'con1[' + str(j) + ']')
+
+    # Constraints 2: weight capacity
+    for j in J:
+        model.addConstr(quicksum(x[i,j] for i in I) <= data.maxweight[j], 'con2[' + str(j) + ']')
+
+    # Constraints 3: available amount
+    for i in I:
+        model.addConstr(quicksum(x[i,j] for j in J) <= data.cargoquantity[i], 'con3[' + str(i) + ']')
+
+    # Constraint 4: weight balance first compartment with other compartments
+    for j in range(1, len(J)):
+        model.addConstr(quicksum(x[i,0] for i in I) * data.maxweight[j] == quicksum(x[i,j] for i in I) * data.maxweight[0], 'con4[' + str(j) + ']')
+
+    model.update()
+    return model, x
@@ -0,0 +1,131 @@
+# Column generation for the per-grade model
+#
+# The per-grade LP has a column x[i,j,t] for every supplier, grade and
+# period. With thousands of candidate scrap lots most of them stay at 0, so
+# column_generation starts from the `start` cheapest suppliers and adds
+# columns only when they can lower the cost. After each solve of this
+# restricted master the reduced cost of every missing column is
+#
+#     cost_i - pi1[i,t] + nickel_i pi4[j,t] + chromium_i pi5[j,t] - pi6[j,t]
+#
+# with pi the duals of the supplier limit (con1), the nickel and chromium
+# balances (con4, con5) and the mass balance (con6). The most negative
+# `columns` per grade and period are added; when none is negative the master
+# solution is optimal for the full LP.
+#
+# The capacity row con1[i,t] is created with the first column of supplier i
+# in period t (until then its dual is 0). An artificial column per grade and
+# period, blended exactly to the grade and priced at `penalty`, keeps the
+# master feasible while the subset cannot yet meet the targets; if it is
+# still used at the end, the instance is infeasible.
+
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from gurobipy import GRB, Column, MVar, Model
+
+
+def column_generation(data, env=None, start=10, columns=1, penalty=None, tol=1e-9, maxiter=10000):
+    """Solve the per-grade LP by column generation; returns a dict with status, objVal, x, s, p, iterations, columns and runtime."""
+    nI, nJ, nT = data.shape
+    begin = time.perf_counter()
+    if penalty is None:
+        penalty = 1000 * (data.cost.max() + data.holdingcosts.max() * nT + 1)
+
+    model = Model('StainlessSteelProductionColgen', env=env)
+
+    # ---- Decission variables ----
+
+    s = model.addMVar((nJ, nT), lb=0, obj=np.repeat(data.holdingcosts[:, None], nT, axis=1), name='S')
+    p = model.addMVar((nJ, nT), lb=0, obj=0, name='P')
+    a = model.addMVar((nJ, nT), lb=0, obj=penalty, name='A')
+    model.modelSense = GRB.MINIMIZE
+
+    # ---- Constraints ----
+
+    net_demand = data.demand.copy()
+    net_demand[:, 0] -= data.initialstock
+    carry = sp.kron(sp.identity(nJ), sp.eye(nT, k=-1) - sp.identity(nT))
+    stock_production = MVar.fromlist(s.tolist() + p.tolist()).reshape(-1)
+    production_artificial = MVar.fromlist(p.tolist() + a.tolist()).reshape(-1)
+    model.addMConstr(sp.hstack([carry, sp.identity(nJ * nT)]).tocsr(), stock_production, GRB.EQUAL, net_demand.ravel(), name='con2')
+    model.addMConstr(sp.kron(np.ones((1, nJ)), sp.identity(nT)).tocsr(), p.reshape(-1), GRB.LESS_EQUAL,
+                     np.full(nT, data.maxmonth, dtype=float), name='con3')
+    grade = lambda coef: np.repeat(coef, nT)
+    con4 = model.addMConstr(sp.hstack([sp.diags(grade(data.nidist)), -sp.diags(grade(data.nidist))]).tocsr(),
+                            production_artificial, GRB.EQUAL, np.zeros(nJ * nT), name='con4')
+    con5 = model.addMConstr(sp.hstack([sp.diags(grade(data.chdist)), -sp.diags(grade(data.chdist))]).tocsr(),
+                            production_artificial, GRB.EQUAL, np.zeros(nJ * nT), name='con5')
+    con6 = model.addMConstr(sp.hstack([-sp.identity(nJ * nT), sp.identity(nJ * nT)]).tocsr(),
+                            production_artificial, GRB.EQUAL, np.zeros(nJ * nT), name='con6')
+    model.update()
+    con4, con5, con6 = (c.tolist() for c in (con4, con5, con6))
+
+    con1 = {}
+    x = {}
+
+    def add_column(i, j, t):
+        row = j * nT + t
+        constrs = [con4[row], con5[row], con6[row]]
+        coeffs = [-data.nickel[i], -data.chromium[i], 1.0]
+        if (i, t) in con1:
+            constrs.append(con1[i, t])
+            coeffs.append(1.0)
+        x[i, j, t] = var = model.addVar(lb=0, obj=data.cost[i], column=Column(coeffs, constrs), name='X[%d,%d,%d]' % (i, j, t))
+        if (i, t) not in con1:
+            con1[i, t] = model.addLConstr(var, GRB.LESS_EQUAL, data.maxpermonth[i], name='con1[%d,%d]' % (i, t))
+
+    for i in np.argsort(data.cost, kind='stable')[:start]:
+        for j in data.J:
+            for t in data.T:
+                add_column(i, j, t)
+
+    present = np.zeros((nI, nJ, nT), dtype=bool)
+    for key in x:
+        present[key] = True
+
+    # ---- Pricing loop ----
+
+    iterations = 0
+    while iterations < maxiter:
+        model.optimize()
+        iterations += 1
+        if model.status != GRB.OPTIMAL:
+            break
+
+        pi1 = np.zeros((nI, nT))
+        keys = list(con1)
+        if keys:
+            idx = tuple(np.array(keys).T)
+            pi1[idx] = model.getAttr('Pi', [con1[k] for k in keys])
+        pi4, pi5, pi6 = (np.reshape(model.getAttr('Pi', c), (nJ, nT)) for c in (con4, con5, con6))
+
+        reduced = (data.cost[:, None, None] - pi1[:, None, :] + data.nickel[:, None, None] * pi4
+                   + data.chromium[:, None, None] * pi5 - pi6)
+        reduced[present] = np.inf
+
+        # the `columns` most negative reduced costs per grade and period
+        k = min(columns, nI)
+        best = np.argpartition(reduced, k - 1, axis=0)[:k]
+        values = np.take_along_axis(reduced, best, axis=0)
+        chosen = np.argwhere(values < -tol)
+        if len(chosen) == 0:
+            break
+        for r, j, t in chosen:
+            add_column(best[r, j, t], j, t)
+            present[best[r, j, t], j, t] = True
+
+    result = {'iterations': iterations, 'columns': len(x), 'runtime': time.perf_counter() - begin}
+    if model.status != GRB.OPTIMAL:
+        result.update(status=model.status, objVal=np.nan)
+    elif a.X.sum() > 1e-6:
+        result.update(status=GRB.INFEASIBLE, objVal=np.nan)
+    else:
+        xs = np.zeros((nI, nJ, nT))
+        keys = list(x)
+        if keys:
+            xs[tuple(np.array(keys).T)] = model.getAttr('X', [x[k] for k in keys])
+        result.update(status=GRB.OPTIMAL, objVal=model.objVal, x=xs, s=s.X, p=p.X)
+    model.dispose()
+    return result
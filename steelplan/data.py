@@ -0,0 +1,75 @@
+# Steel production data
+#
+# The assignment data of LinearProgrammingModel_assignment1.py, bundled so the
+# model builders in this package can be called on any instance instead of
+# relying on module-level script variables.
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+@dataclass
+class SteelData:
+    """One steel blending instance: suppliers i, steel grades j and months t."""
+
+    suppliername: tuple
+    chromium: np.ndarray        # fraction chromium per supplier
+    nickel: np.ndarray          # fraction nickel per supplier
+    copper: np.ndarray          # fraction copper per supplier
+    maxpermonth: np.ndarray     # maximum amount that can be supplied per month
+    cost: np.ndarray            # cost per kg per supplier
+    nidist: np.ndarray          # fraction nickel required per grade
+    chdist: np.ndarray          # fraction chromium required per grade
+    holdingcosts: np.ndarray    # holding cost per kg per grade
+    maxmonth: float             # maximum monthly production
+    months: list
+    demand: np.ndarray          # demand per grade (rows) and month (columns)
+    electrolysisFixedCost: float = 100      # fixed cost of electrolysis per month (if applied)
+    electrolysisVariableCost: float = 5     # cost per kg of copper removed by electrolysis
+    initialstock: np.ndarray = None         # stock per grade at the start of the first month (default none)
+
+    def __post_init__(self):
+        if self.initialstock is None:
+            self.initialstock = np.zeros(len(self.nidist))
+        for name in ('chromium', 'nickel', 'copper', 'maxpermonth', 'cost', 'nidist', 'chdist', 'holdingcosts', 'demand', 'initialstock'):
+            setattr(self, name, np.asarray(getattr(self, name), dtype=float))
+
+    @property
+    def I(self):
+        return range(len(self.suppliername))    # set of suppliers
+
+    @property
+    def J(self):
+        return range(len(self.nidist))          # set of steel types
+
+    @property
+    def T(self):
+        return range(len(self.months))          # set of months
+
+    @property
+    def shape(self):
+        return len(self.I), len(self.J), len(self.T)
+
+
+def default_data():
+    """The instance of the assignment (18/10, 18/8 and 18/0 over twelve months)."""
+    return SteelData(
+        suppliername=('sup_a', 'sup_b', 'sup_c', 'sup_d', 'sup_e'),
+        chromium=(0.18, 0.25, 0.15, 0.14, 0),
+        nickel=(0, 0.15, 0.10, 0.16, 0.10),
+        copper=(0, 0.04, 0.02, 0.05, 0.03),
+        maxpermonth=(90, 30, 50, 70, 20),
+        cost=(5, 10, 9, 7, 8.5),
+        nidist=(0.10, 0.08, 0),
+        chdist=(0.18, 0.18, 0.18),
+        holdingcosts=(20, 10, 5),
+        maxmonth=100,
+        months=list(months),
+        demand=[[25, 25, 0, 0, 0, 50, 12, 0, 10, 10, 45, 99],
+                [10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10],
+                [5, 20, 80, 25, 50, 125, 150, 80, 40, 35, 3, 100]],
+    )
@@ -0,0 +1,82 @@
+# Demand files
+#
+# Reads demand into one contiguous float array (grades x periods) that the
+# model builders use directly. A file holds one row per grade and one column
+# per period:
+#
+#   .npy      a 2-d array, memory-mapped instead of read into memory; a
+#             float64 C-order file is returned as the memory map itself
+#   .csv      comma separated, with a header of period names and the grade
+#             name in the first column; read in chunks of rows. A file
+#             whose first line is all numbers is the plain matrix of
+#             scenarios.load_scenarios (no header, no grade names)
+#   .parquet  the same layout as the csv; read one record batch at a time.
+#             The grade column is the index stored in the pandas metadata
+#             (as written by DataFrame.to_parquet), else the first column
+
+import os
+from dataclasses import replace
+
+import numpy as np
+
+
+def _csv_has_header(path):
+    """False if every field of the first line is a number, as in a plain demand matrix."""
+    with open(path) as f:
+        fields = f.readline().strip().split(',')
+    try:
+        [float(field) for field in fields]
+    except ValueError:
+        return True
+    return False
+
+
+def load_demand(path, chunksize=1024):
+    """Read a demand file; returns (demand, grades, periods), grades and periods None for .npy and headerless .csv files."""
+    ext = os.path.splitext(path)[1]
+    if ext == '.npy':
+        demand = np.load(path, mmap_mode='r')
+        if demand.dtype != np.float64 or not demand.flags.c_contiguous:
+            demand = np.ascontiguousarray(demand, dtype=float)
+        return demand, None, None
+
+    if ext == '.csv':
+        import pandas as pd
+
+        if _csv_has_header(path):
+            chunks = pd.read_csv(path, index_col=0, chunksize=chunksize)
+        else:
+            chunks = pd.read_csv(path, header=None, chunksize=chunksize)
+            return np.ascontiguousarray(np.vstack([chunk.to_numpy(dtype=float) for chunk in chunks])), None, None
+    elif ext == '.parquet':
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        metadata = parquet.schema_arrow.pandas_metadata or {}
+        # a RangeIndex is stored as a dict, not as a column
+        index = [name for name in metadata.get('index_columns', []) if isinstance(name, str)]
+        chunks = (batch.to_pandas() for batch in parquet.iter_batches(batch_size=chunksize))
+    else:
+        raise ValueError('unsupported demand file %r, expected .npy, .csv or .parquet' % path)
+
+    grades, rows, periods = [], [], None
+    for chunk in chunks:
+        if ext == '.parquet' and not index:
+            chunk = chunk.set_index(chunk.columns[0])
+        elif ext == '.parquet' and set(index) <= set(chunk.columns):
+            # older pyarrow returns the stored index as ordinary columns
+            chunk = chunk.set_index(index)
+        periods = list(chunk.columns)
+        grades.extend(chunk.index)
+        rows.append(chunk.to_numpy(dtype=float))
+    demand = np.ascontiguousarray(np.vstack(rows))
+    return demand, grades, periods
+
+
+def with_demand(data, path, chunksize=1024):
+    """data with the demand (and period names, if the file has them) read from path."""
+    demand, grades, periods = load_demand(path, chunksize)
+    if demand.shape[0] != len(data.J):
+        raise ValueError('%s has demand for %d grades, the data has %d' % (path, demand.shape[0], len(data.J)))
+    months = periods if periods is not None else ['t%d' % t for t in range(demand.shape[1])]
+    return replace(data, demand=demand, months=months)
@@ -0,0 +1,149 @@
+# Stainless steel production with copper limit and electrolysis
+#
+# The model of LinearProgrammingModel_assignment1e.py as a function: on top of
+# the blending LP, each month either stays below the copper limit or pays for
+# electrolysis (binary b[t]). set_copper_limit changes the limit of an
+# existing model in place, so a sweep over limits reuses one model.
+#
+# The copper limit con7 is switched off by b[t] in one of three ways:
+#   'bigM'       copper <= limit * production + 1e9 * b[t] (as in the script)
+#   'tightM'     the same with M = sum_i copper_i * maxpermonth_i, the most
+#                copper that can be bought in a month
+#   'indicator'  a Gurobi indicator constraint b[t] = 0 -> copper <= limit * production
+#
+# The script multiplies the copper bought in a month with b[t] in the
+# electrolysis cost and in con6, which makes the model a non-convex MIQCP.
+# With linear=True that product is replaced by the copper removed w[t]:
+#   w[t] <= Ucu * b[t],  w[t] <= copper[t],  w[t] >= copper[t] - Ucu * (1 - b[t])
+# with Ucu the most copper that can be bought in a month, so w[t] equals
+# copper[t] * b[t] exactly and the model is a MILP.
+
+from gurobipy import *
+
+
+formulations = ('bigM', 'tightM', 'indicator')
+
+
+def build_electrolysis_model(data, copperLimit, env=None, formulation='bigM', linear=False):
+    """Build the copper/electrolysis MIP; returns (model, vars) with vars a dict of x, s, p, b, con7."""
+    if formulation not in formulations:
+        raise ValueError('unknown electrolysis formulation %r, expected one of %s' % (formulation, ', '.join(formulations)))
+
+    model = Model('StainlessSteelProduction', env=env)
+
+    I, J, T = data.I, data.J, data.T
+
+    c_i = data.cost
+    h_j = data.holdingcosts
+    d_jt = data.demand
+    u_i = data.maxpermonth
+    crsup_i = data.chromium
+    nisup_i = data.nickel
+    cusup_i = data.copper
+    crdem_j = data.chdist
+    nidem_j = data.nidist
+    ef_t = data.electrolysisFixedCost
+    ev_t = data.electrolysisVariableCost
+
+    # ---- Decission variables ----
+
+    x = {}
+    for i in I:
+        for t in T:
+            x[i,t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, name = 'x[' + str(i) + ',' + str(t) + ']')
+
+    s = {}
+    for j in J:
+        for t in T:
+            s[j,t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, name = 's[' + str(j) + ',' + str(t) + ']')
+
+    p = {}
+    for j in J:
+        for t in T:
+            p[j,t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, name = 'p[' + str(j) + ',' + str(t) + ']')
+
+    b = {}
+    for t in T:
+        b[t] = model.addVar(vtype = GRB.BINARY, name = 'ElecBin[' + str(t) + ']')
+
+    copperPct = {}
+    for t in T:
+        copperPct[t] = quicksum(x[i,t] * cusup_i[i] for i in I)
+
+    # copper removed by electrolysis, copperPct[t] * b[t]
+    Ucu = sum(cusup_i[i] * u_i[i] for i in I)
+    w = {}
+    if linear:
+        for t in T:
+            w[t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, name = 'w[' + str(t) + ']')
+            model.addConstr(w[t] <= Ucu * b[t], 'w_bin[' + str(t) + ']')
+            model.addConstr(w[t] <= copperPct[t], 'w_cu[' + str(t) + ']')
+            model.addConstr(w[t] >= copperPct[t] - Ucu * (1 - b[t]), 'w_cu_bin[' + str(t) + ']')
+    else:
+        for t in T:
+            w[t] = copperPct[t] * b[t]
+
+    costHolding = quicksum(h_j[j] * s[j,t] for j in J for t in T)
+    costBuying = quicksum(c_i[i] * x[i,t] for i in I for t in T)
+    costElectrolysis = quicksum(ef_t * b[t] + ev_t * w[t] for t in T)
+
+    model.setObjective(costHolding + costBuying + costElectrolysis, GRB.MINIMIZE)
+
+    # ---- Constraints ----
+
+    # Constraint 1: alloy supply
+    for i in I:
+        for t in T:
+            model.addConstr(x[i, t] <= u_i[i], 'con1[' + str(i) + ',' + str(t) + ']')
+
+    # Constraint 2: demand satisfaction
+    for j in J:
+        for t in T:
+            if t == 0:
+                model.addConstr(p[j,t] + data.initialstock[j] == (d_jt[j,t] + s[j,t]), 'con2[' + str(j) + ',' + str(t) + ']')
+            else:
+                model.addConstr((p[j,t] + s[j,t-1]) == (d_jt[j,t] + s[j,t]), 'con2[' + str(j) + ',' + str(t) + ']')
+
+    # Constraint 3: max monthly production
+    for t in T:
+        model.addConstr(quicksum(p[j,t] for j in J) <= data.maxmonth, 'con3[' + str(t) + ']')
+
+    # Constraint 4: nickel distribution
+    for t in T:
+        model.addConstr(quicksum(nidem_j[j] * p[j, t] for j in J) == quicksum(nisup_i[i] * x[i, t] for i in I), 'con4[' + str(t) + ']')
+
+    # Constraint 5: chromium distribution
+    for t in T:
+        model.addConstr(quicksum(crdem_j[j] * p[j, t] for j in J) == quicksum(crsup_i[i] * x[i, t] for i in I), 'con5[' + str(t) + ']')
+
+    # Constraint 6: supply = production, corrected for the copper removed by electrolysis
+    for t in T:
+        model.addConstr(quicksum(x[i,t] for i in I) == quicksum(p[j,t] for j in J) - w[t], 'con6[' + str(t) + ']')
+
+    # Constraint 7: copper limit, switched off in months with electrolysis
+    M = 1000000000 if formulation == 'bigM' else Ucu
+    production = {}
+    con7 = {}
+    for t in T:
+        production[t] = quicksum(p[j,t] for j in J)
+        if formulation == 'indicator':
+            con7[t] = model.addGenConstrIndicator(b[t], False, copperPct[t] <= copperLimit * production[t], name='con7_bin0[' + str(t) + ']')
+        else:
+            con7[t] = model.addConstr(copperPct[t] <= (copperLimit * quicksum(p[j,t] for j in J)) + M * b[t], 'con7_bin0[' + str(t) + ']')
+
+    model.update()
+    return model, {'x': x, 's': s, 'p': p, 'b': b, 'con7': con7, 'w': w, 'copperPct': copperPct, 'production': production, 'formulation': formulation}
+
+
+def set_copper_limit(model, vars, copperLimit):
+    """Change the copper limit of con7 in place (the coefficient of every p[j,t] is -copperLimit)."""
+    con7, p = vars['con7'], vars['p']
+    if vars['formulation'] == 'indicator':
+        # indicator constraints cannot be edited, replace them
+        for t in con7:
+            model.remove(con7[t])
+            con7[t] = model.addGenConstrIndicator(vars['b'][t], False, vars['copperPct'][t] <= copperLimit * vars['production'][t],
+                                                  name='con7_bin0[' + str(t) + ']')
+        return
+    for (j, t), var in p.items():
+        model.chgCoeff(con7[t], var, -copperLimit)
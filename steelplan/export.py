@@ -0,0 +1,78 @@
+# Model export
+#
+# Writing a model is opt-in. Gurobi picks the format from the file extension,
+# so besides .lp this also covers compressed and binary formats such as
+# .mps.bz2 and .rew (MPS with generic names). export_path gives every run its
+# own file so concurrent runs do not overwrite each other, and with
+# background=True the model is written from a thread while the solve runs.
+# An error in that thread is kept and raised again when the thread is joined,
+# so a failed export is not lost.
+
+import os
+import threading
+import time
+import uuid
+
+from gurobipy import Env
+
+
+def export_path(name='output', fmt='mps.bz2', directory='.'):
+    """A file name unique to this run, e.g. output-20241004-101500-1234-1a2b3c4d.mps.bz2."""
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    return os.path.join(directory, '%s-%s-%d-%s.%s' % (name, stamp, os.getpid(), uuid.uuid4().hex[:8], fmt))
+
+
+class _Writer(threading.Thread):
+    """A thread running write() that re-raises its exception from join()."""
+
+    def __init__(self, write, name):
+        super().__init__(name=name)
+        self.write = write
+        self.error = None
+
+    def run(self):
+        try:
+            self.write()
+        except BaseException as error:
+            self.error = error
+
+    def join(self, timeout=None):
+        super().join(timeout)
+        if self.error is not None and not self.is_alive():
+            error, self.error = self.error, None
+            raise error
+
+
+def write_model(model, path, background=False):
+    """Write model to path; with background=True write a copy from a thread and return the (started) thread."""
+    model.update()
+    if not background:
+        model.write(path)
+        return None
+
+    # A model cannot be written while it is being optimized, and an environment
+    # should not be used from two threads at once, so the writer gets a copy of
+    # the model in an environment of its own.
+    env = Env(params={'OutputFlag': 0})
+    copy = model.copy(env=env)
+
+    def write():
+        try:
+            copy.write(path)
+        finally:
+            copy.dispose()
+            env.dispose()
+
+    thread = _Writer(write, 'write %s' % os.path.basename(path))
+    thread.start()
+    return thread
+
+
+def optimize(model, path=None, background=True):
+    """Optimize model, writing it to path (if given) in parallel with the solve; raises if the write failed."""
+    thread = write_model(model, path, background=background) if path else None
+    try:
+        model.optimize()
+    finally:
+        if thread is not None:
+            thread.join()
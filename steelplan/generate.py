@@ -0,0 +1,68 @@
+# Synthetic steel blending instances
+#
+# generate(nI, nJ, nT, seed) builds a random instance of any size that is
+# feasible by construction, for benchmarks:
+#
+# - every supplier gets a random chromium, nickel and copper fraction and a
+#   monthly capacity,
+# - every grade is a fixed mix of `mix` random suppliers (Dirichlet weights),
+#   and its chromium and nickel targets are the fractions of that mix, so each
+#   grade can be blended on its own (also in the per-grade model),
+# - demand is random and scaled down per period until producing exactly the
+#   demand with these mixes stays within `load` times the production
+#   capacity maxmonth and every supplier capacity.
+#
+# Producing the demand of each period in that period is then a feasible plan.
+
+import numpy as np
+
+from .data import SteelData
+
+
+sizes = {
+    'small': (5, 3, 12),
+    'medium': (100, 10, 52),
+    'large': (1000, 50, 730),
+}
+
+
+def generate(nI, nJ, nT, seed=0, load=0.9, mix=3):
+    """A random, feasible SteelData instance with nI suppliers, nJ grades and nT periods."""
+    rng = np.random.default_rng(seed)
+    mix = min(mix, nI)
+
+    chromium = rng.uniform(0, 0.25, nI)
+    nickel = rng.uniform(0, 0.16, nI)
+    copper = rng.uniform(0, 0.05, nI)
+    cost = rng.uniform(5, 10, nI)
+    maxpermonth = np.round(rng.uniform(20, 90, nI) * max(1, 3 * nJ / nI))
+    maxmonth = 35 * nJ
+
+    # grade j is the mix weights[j] of the suppliers
+    weights = np.zeros((nJ, nI))
+    for j in range(nJ):
+        weights[j, rng.choice(nI, mix, replace=False)] = rng.dirichlet(np.ones(mix))
+    chdist = weights @ chromium
+    nidist = weights @ nickel
+
+    # scale each period so the demand fits the production and supplier capacities
+    demand = rng.uniform(0, 1, (nJ, nT)) * maxmonth / nJ * 2
+    scrap = weights.T @ demand                                   # supply needed per supplier and period
+    scale = np.minimum(load * maxmonth / np.maximum(demand.sum(axis=0), 1e-9),
+                       (load * maxpermonth[:, None] / np.maximum(scrap, 1e-9)).min(axis=0))
+    demand = np.floor(demand * np.minimum(scale, 1))
+
+    return SteelData(
+        suppliername=tuple('sup_%d' % i for i in range(nI)),
+        chromium=chromium,
+        nickel=nickel,
+        copper=copper,
+        maxpermonth=maxpermonth,
+        cost=cost,
+        nidist=nidist,
+        chdist=chdist,
+        holdingcosts=rng.integers(5, 21, nJ),
+        maxmonth=maxmonth,
+        months=['t%d' % t for t in range(nT)],
+        demand=demand,
+    )
@@ -0,0 +1,184 @@
+# Build and solve profiling
+#
+# A Profiler records the wall time of named phases (variables, constraints,
+# update, write, optimize, results, ...), model size, Gurobi Runtime,
+# NodeCount and IterCount and peak memory, and writes one JSON line per
+# solve. Peak memory is the resident set size of the process (Python and
+# Gurobi together); with trace_memory=True the Python allocation peak of
+# every phase is recorded as well, at the cost of slower model building.
+#
+# SteelPlanningModel takes a Profiler and times its build, optimize and
+# results phases. Any of the scripts can be profiled without editing it:
+#
+#     python -m steelplan.instrument [--output profile.jsonl] [--trace-memory] script.py
+#
+# which replaces gurobipy.Model by a subclass that times its methods, runs the
+# script and writes a line for every optimize call plus a summary line.
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import gurobipy
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024     # kB on Linux
+
+
+def model_stats(model):
+    """Size of the model and the statistics of its last solve."""
+    stats = {'rows': model.NumConstrs, 'cols': model.NumVars, 'nonzeros': model.NumNZs,
+             'qconstrs': model.NumQConstrs, 'genconstrs': model.NumGenConstrs, 'status': model.status}
+    for key, attr in (('objVal', 'ObjVal'), ('runtime', 'Runtime'), ('iterCount', 'IterCount'), ('barIterCount', 'BarIterCount'),
+                      ('nodeCount', 'NodeCount'), ('maxMemUsedGB', 'MaxMemUsed')):
+        try:
+            stats[key] = model.getAttr(attr)
+        except (gurobipy.GurobiError, AttributeError):
+            stats[key] = None
+    return stats
+
+
+class Profiler:
+    """Collects phase timings and solve statistics and writes them as JSON lines to output (a path or a stream)."""
+
+    def __init__(self, name, output=None, trace_memory=False, **fields):
+        self.name = name
+        self.output = output if output is not None else sys.stderr
+        self.trace_memory = trace_memory
+        self.fields = fields
+        self.phases = {}
+        self.solves = 0
+        self.wall = 0.0     # total time in phases, over all solves
+        self._depth = 0
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as phase name; phases nested in another phase are counted in the outer one."""
+        if self._depth:
+            yield
+            return
+        self._depth += 1
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            phase = self.phases.setdefault(name, {'wall': 0.0, 'calls': 0})
+            phase['wall'] += time.perf_counter() - start
+            phase['calls'] += 1
+            self.wall += time.perf_counter() - start
+            if self.trace_memory:
+                phase['peakPythonMB'] = max(phase.get('peakPythonMB', 0), tracemalloc.get_traced_memory()[1] / 2**20)
+
+    def emit(self, record):
+        """Write one JSON line."""
+        line = json.dumps(dict({'name': self.name}, **self.fields, **record), default=float) + '\n'
+        if isinstance(self.output, str):
+            with open(self.output, 'a') as out:
+                out.write(line)
+        else:
+            self.output.write(line)
+            self.output.flush()
+
+    def solved(self, model):
+        """Emit the phases since the previous solve together with the statistics of this solve."""
+        self.solves += 1
+        self.emit(dict({'type': 'solve', 'solve': self.solves, 'phases': self.phases, 'peakRssMB': peak_rss_mb()}, **model_stats(model)))
+        self.phases = {}
+
+    def close(self):
+        """Emit the phases recorded after the last solve (e.g. results), if any."""
+        if self.phases:
+            self.emit({'type': 'phases', 'phases': self.phases})
+            self.phases = {}
+
+
+# ---- Profiling unmodified scripts ----
+
+method_phases = {
+    'addVar': 'variables', 'addVars': 'variables', 'addMVar': 'variables',
+    'addConstr': 'constraints', 'addConstrs': 'constraints', 'addLConstr': 'constraints', 'addQConstr': 'constraints',
+    'addMConstr': 'constraints', 'addGenConstrIndicator': 'constraints',
+    'setObjective': 'objective', 'update': 'update', 'write': 'write', 'optimize': 'optimize',
+}
+
+
+def profiled_model_class(profilers, output, trace_memory, script):
+    """A gurobipy.Model subclass that times its methods per phase and emits a line after every optimize."""
+
+    class ProfiledModel(gurobipy.Model):
+        def __init__(self, name='', *args, **kwargs):
+            super().__init__(name, *args, **kwargs)
+            self._profiler = Profiler(name, output, trace_memory, script=script)
+            profilers.append(self._profiler)
+
+    def timed(method, phase):
+        base = getattr(gurobipy.Model, method)
+
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, '_profiler', None)
+            if profiler is None:    # called by Model.__init__ itself
+                return base(self, *args, **kwargs)
+            with profiler.phase(phase):
+                result = base(self, *args, **kwargs)
+            if method == 'optimize':
+                profiler.solved(self)
+                profiler.last_solved = time.perf_counter()
+            return result
+
+        wrapper.__name__ = method
+        return wrapper
+
+    for method, phase in method_phases.items():
+        setattr(ProfiledModel, method, timed(method, phase))
+    return ProfiledModel
+
+
+def profile_script(script, output=None, trace_memory=False):
+    """Run a model script with gurobipy.Model profiled; emits a solve line per optimize call and a summary line."""
+    import runpy
+
+    profilers = []
+    original = gurobipy.Model
+    profiled = profiled_model_class(profilers, output, trace_memory, script)
+    # modules that did `from gurobipy import *` before (e.g. this package) hold their own reference
+    patched = [module for module in list(sys.modules.values()) if getattr(module, 'Model', None) is original]
+    for module in patched:
+        module.Model = profiled
+    start = time.perf_counter()
+    try:
+        runpy.run_path(script, run_name='__main__')
+    finally:
+        for module in patched:
+            module.Model = original
+        end = time.perf_counter()
+        for profiler in profilers:
+            profiler.close()
+        summary = Profiler(os.path.basename(script), output, script=script)
+        results = [end - p.last_solved for p in profilers if hasattr(p, 'last_solved')]
+        summary.emit({'type': 'summary', 'wall': end - start, 'outsideGurobi': end - start - sum(p.wall for p in profilers),
+                      'models': len(profilers),
+                      'solves': sum(p.solves for p in profilers),
+                      'results': results[-1] if results else None, 'peakRssMB': peak_rss_mb()})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Profile a steel or cargo model script.')
+    parser.add_argument('script')
+    parser.add_argument('--output', help='append JSON lines to this file instead of stderr')
+    parser.add_argument('--trace-memory', action='store_true', help='also record the Python allocation peak per phase')
+    args = parser.parse_args()
+
+    sys.argv = [args.script]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    profile_script(args.script, args.output, args.trace_memory)
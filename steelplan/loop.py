@@ -0,0 +1,78 @@
+# Stainless steel production - element-wise model builder
+#
+# The construction of LinearProgrammingModel_assignment1.py wrapped in a
+# function: one addVar call per variable and one quicksum per constraint.
+# Kept as the reference the matrix builder is checked and benchmarked against.
+
+from gurobipy import *
+
+
+def build_loop_model(data, env=None):
+    """Build the StainlessSteelProduction LP element by element; returns (model, x, s, p)."""
+    model = Model('StainlessSteelProduction', env=env)
+
+    I, J, T = data.I, data.J, data.T
+
+    c_i = data.cost
+    h_j = data.holdingcosts
+    d_jt = data.demand
+    u_i = data.maxpermonth
+    crsup_i = data.chromium
+    nisup_i = data.nickel
+    crdem_j = data.chdist
+    nidem_j = data.nidist
+
+    # ---- Decission variables ----
+
+    x = {}
+    for i in I:
+        for t in T:
+            x[i,t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, obj = c_i[i], name = 'X[' + str(i) + ',' + str(t) + ']')
+
+    s = {}
+    for j in J:
+        for t in T:
+            s[j,t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, obj = h_j[j], name = 'S[' + str(j) + ',' + str(t) + ']')
+
+    p = {}
+    for j in J:
+        for t in T:
+            p[j,t] = model.addVar(lb = 0, vtype = GRB.CONTINUOUS, obj = 0, name = 'P[' + str(j) + ',' + str(t) + ']')
+
+    model.update()
+    model.modelSense = GRB.MINIMIZE
+    model.update()
+
+    # ---- Constraints ----
+
+    # Constraint 1: alloy supply
+    for i in I:
+        for t in T:
+            model.addConstr(x[i, t] <= u_i[i], 'con1[' + str(i) + ',' + str(t) + ']')
+
+    # Constraint 2: demand satisfaction
+    for j in J:
+        for t in T:
+            if t == 0:
+                model.addConstr(p[j,t] + data.initialstock[j] == (d_jt[j,t] + s[j,t]), 'con2[' + str(j) + ',' + str(t) + ']')
+            else:
+                model.addConstr((p[j,t] + s[j,t-1]) == (d_jt[j,t] + s[j,t]), 'con2[' + str(j) + ',' + str(t) + ']')
+
+    # Constraint 3: max monthly production
+    for t in T:
+        model.addConstr(quicksum(p[j,t] for j in J) <= data.maxmonth, 'con3[' + str(t) + ']')
+
+    # Constraint 4: nickel distribution
+    for t in T:
+        model.addConstr(quicksum(nidem_j[j] * p[j, t] for j in J) == quicksum(nisup_i[i] * x[i, t] for i in I), 'con4[' + str(t) + ']')
+
+    # Constraint 5: chromium distribution
+    for t in T:
+        model.addConstr(quicksum(crdem_j[j] * p[j, t] for j in J) == quicksum(crsup_i[i] * x[i, t] for i in I), 'con5[' + str(t) + ']')
+
+    # Constraint 6: supply = production
+    for t in T:
+        model.addConstr(quicksum(x[i, t] for i in I) == quicksum(p[j, t] for j in J), 'con6[' + str(t) + ']')
+
+    model.update()
+    return model, x, s, p
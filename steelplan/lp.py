@@ -0,0 +1,92 @@
+# Solver-independent linear programs
+#
+# A LinearProgram is the steel or cargo model as plain arrays: objective c,
+# sparse constraint matrix A with a sense ('<', '=', '>') and right-hand side
+# b per row, and variable bounds. The backends in backends.py hand the same
+# LinearProgram to Gurobi or to an open-source solver.
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import scipy.sparse as sp
+
+from .matrix import constraint_blocks
+
+
+@dataclass
+class LinearProgram:
+    c: np.ndarray
+    A: sp.csr_matrix
+    sense: np.ndarray
+    b: np.ndarray
+    lb: np.ndarray
+    ub: np.ndarray
+    integer: np.ndarray = None      # True for integer columns (default all continuous)
+    maximize: bool = False
+    columns: dict = field(default_factory=dict)     # name -> (first column, shape)
+    rows: dict = field(default_factory=dict)        # name -> (first row, number of rows)
+
+    def __post_init__(self):
+        if self.integer is None:
+            self.integer = np.zeros(len(self.c), dtype=bool)
+
+    def split(self, values):
+        """Cut a solution vector into the arrays of columns, e.g. {'x': ..., 's': ..., 'p': ...}."""
+        out = {}
+        for name, (start, shape) in self.columns.items():
+            out[name] = np.asarray(values[start:start + int(np.prod(shape))]).reshape(shape)
+        return out
+
+
+def stack(blocks, columns, c, maximize=False):
+    """A LinearProgram from an ordered dict of (A, sense, b) row blocks over the same columns."""
+    rows, first = {}, 0
+    for name, (A, _, b) in blocks.items():
+        rows[name] = (first, A.shape[0])
+        first += A.shape[0]
+    A = sp.vstack([A for A, _, _ in blocks.values()], format='csr')
+    A.eliminate_zeros()
+    sense = np.concatenate([np.full(len(b), sense) for _, sense, b in blocks.values()])
+    b = np.concatenate([b for _, _, b in blocks.values()]).astype(float)
+    n = A.shape[1]
+    return LinearProgram(c=np.asarray(c, dtype=float), A=A, sense=sense, b=b, lb=np.zeros(n), ub=np.full(n, np.inf),
+                         maximize=maximize, columns=columns, rows=rows)
+
+
+def steel_lp(data, per_grade=False):
+    """The StainlessSteelProduction LP (build_matrix_model) as a LinearProgram with columns x, s and p."""
+    nI, nJ, nT = data.shape
+    x_shape = (nI, nJ, nT) if per_grade else (nI, nT)
+    nX = int(np.prod(x_shape))
+    c = np.concatenate([np.broadcast_to(data.cost.reshape((nI,) + (1,) * (len(x_shape) - 1)), x_shape).ravel(),
+                        np.repeat(data.holdingcosts, nT), np.zeros(nJ * nT)])
+    columns = {'x': (0, x_shape), 's': (nX, (nJ, nT)), 'p': (nX + nJ * nT, (nJ, nT))}
+    return stack(constraint_blocks(data, per_grade), columns, c)
+
+
+def cargo_lp(data):
+    """The AirplaneCargo LP (build_cargo_model) as a LinearProgram with columns x[i,j]."""
+    nI, nJ = data.shape
+    eye_J = sp.identity(nJ)
+    # x[i,j] is column i*J + j
+    per_comp = lambda coef: sp.kron(coef[None, :], eye_J)
+    balance = sp.hstack([sp.csr_matrix((nJ - 1, 1)), sp.identity(nJ - 1)]) * data.maxweight[0] \
+        - sp.csr_matrix((data.maxweight[1:], (np.arange(nJ - 1), np.zeros(nJ - 1))), shape=(nJ - 1, nJ))
+    blocks = {
+        'con1': (per_comp(data.cargovolume), '<', data.maxvolume),
+        'con2': (per_comp(np.ones(nI)), '<', data.maxweight),
+        'con3': (sp.kron(sp.identity(nI), np.ones((1, nJ))), '<', data.cargoquantity),
+        'con4': (sp.kron(np.ones((1, nI)), balance), '=', np.zeros(nJ - 1)),
+    }
+    return stack(blocks, {'x': (0, (nI, nJ))}, np.repeat(data.cargoprofit, nJ), maximize=True)
+
+
+def merge(lps):
+    """One block-diagonal LinearProgram solving the independent lps (same sense) at once; returns (lp, first column of each)."""
+    if len({lp.maximize for lp in lps}) > 1:
+        raise ValueError('cannot merge minimization and maximization problems')
+    offsets = np.cumsum([0] + [len(lp.c) for lp in lps])
+    cat = lambda name: np.concatenate([getattr(lp, name) for lp in lps])
+    merged = LinearProgram(c=cat('c'), A=sp.block_diag([lp.A for lp in lps], format='csr'), sense=cat('sense'), b=cat('b'),
+                           lb=cat('lb'), ub=cat('ub'), integer=cat('integer'), maximize=lps[0].maximize)
+    return merged, offsets[:-1]
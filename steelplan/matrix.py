@@ -0,0 +1,93 @@
+# Stainless steel production - matrix model builder
+#
+# Builds the same LP as loop.build_loop_model, but with three addMVar calls and
+# one sparse addMConstr per constraint family. Columns are ordered x, s, p
+# (each row-major, as in the loop version) and rows con1..con6, so both
+# builders give the same constraint matrix.
+#
+# With per_grade=True the scrap is bought per steel grade, x[i,j,t] as in the
+# resit model, and the nickel, chromium and mass balances hold per grade
+# instead of per month.
+#
+# With balance='<=' the nickel and chromium in the scrap may be less than the
+# grades need (con4, con5 as supply <= demand), as in
+# Jochem/Initial/QML-Assignment-1C.py.
+
+import numpy as np
+import scipy.sparse as sp
+from gurobipy import GRB, Model
+
+
+balances = {'=': GRB.EQUAL, '<=': GRB.GREATER_EQUAL}     # -scrap + grade (sense) 0
+
+
+def constraint_blocks(data, per_grade=False, balance='='):
+    """Sparse (A, sense, b) per constraint family over the columns [x, s, p]."""
+    if balance not in balances:
+        raise ValueError("unknown balance %r, expected '=' or '<='" % balance)
+    nI, nJ, nT = data.shape
+    nX = nI * nJ * nT if per_grade else nI * nT
+    eye_T = sp.identity(nT, format='csr')
+    eye_JT = sp.identity(nJ * nT, format='csr')
+    zeros = lambda rows, cols: sp.csr_matrix((rows, cols))
+
+    # inventory balance: p[j,t] + s[j,t-1] - s[j,t] == d[j,t], the initial stock counts as s[j,-1]
+    carry = sp.kron(sp.identity(nJ), sp.eye(nT, k=-1) - eye_T)
+    net_demand = data.demand.copy()
+    net_demand[:, 0] -= data.initialstock
+    sum_J = sp.kron(np.ones((1, nJ)), eye_T)
+
+    if per_grade:
+        # x[i,j,t] is column i*J*T + j*T + t, balances are rows (j,t)
+        supply = sp.kron(sp.identity(nI), sp.kron(np.ones((1, nJ)), eye_T))
+        rows = nJ * nT
+        scrap = lambda coef: sp.kron(coef[None, :], eye_JT)
+        grade = lambda coef: sp.diags(np.repeat(coef, nT))
+    else:
+        supply = sp.identity(nX)
+        rows = nT
+        scrap = lambda coef: sp.kron(coef[None, :], eye_T)
+        grade = lambda coef: sp.kron(coef[None, :], eye_T)
+
+    blocks = {
+        'con1': (sp.hstack([supply, zeros(nI * nT, 2 * nJ * nT)]),
+                 GRB.LESS_EQUAL, np.repeat(data.maxpermonth, nT)),
+        'con2': (sp.hstack([zeros(nJ * nT, nX), carry, eye_JT]),
+                 GRB.EQUAL, net_demand.ravel()),
+        'con3': (sp.hstack([zeros(nT, nX + nJ * nT), sum_J]),
+                 GRB.LESS_EQUAL, np.full(nT, data.maxmonth, dtype=float)),
+        'con4': (sp.hstack([-scrap(data.nickel), zeros(rows, nJ * nT), grade(data.nidist)]),
+                 balances[balance], np.zeros(rows)),
+        'con5': (sp.hstack([-scrap(data.chromium), zeros(rows, nJ * nT), grade(data.chdist)]),
+                 balances[balance], np.zeros(rows)),
+        'con6': (sp.hstack([scrap(np.ones(nI)), zeros(rows, nJ * nT), -grade(np.ones(nJ))]),
+                 GRB.EQUAL, np.zeros(rows)),
+    }
+    for A, _, _ in blocks.values():
+        A.eliminate_zeros()
+    return {name: (A.tocsr(), sense, b) for name, (A, sense, b) in blocks.items()}
+
+
+def build_matrix_model(data, env=None, per_grade=False, balance='='):
+    """Build the StainlessSteelProduction LP with the matrix API; returns (model, x, s, p) as MVars."""
+    model = Model('StainlessSteelProduction', env=env)
+    nI, nJ, nT = data.shape
+
+    # ---- Decission variables ----
+
+    if per_grade:
+        x = model.addMVar((nI, nJ, nT), lb=0, obj=np.broadcast_to(data.cost[:, None, None], (nI, nJ, nT)), name='X')
+    else:
+        x = model.addMVar((nI, nT), lb=0, obj=np.repeat(data.cost[:, None], nT, axis=1), name='X')
+    s = model.addMVar((nJ, nT), lb=0, obj=np.repeat(data.holdingcosts[:, None], nT, axis=1), name='S')
+    p = model.addMVar((nJ, nT), lb=0, obj=0, name='P')
+    model.modelSense = GRB.MINIMIZE
+    model.update()
+
+    # ---- Constraints ----
+
+    for name, (A, sense, b) in constraint_blocks(data, per_grade, balance).items():
+        model.addMConstr(A, None, sense, b, name=name)
+
+    model.update()
+    return model, x, s, p
@@ -0,0 +1,125 @@
+# Steel planning model
+#
+# One entry point for the variants of the steel blending model in this
+# repository:
+#
+#   assignment1   LinearProgrammingModel_assignment1.py, Jochem/Initial/QML-Assignment-1.py
+#   assignment1d  the same with a production capacity of 159 instead of 100
+#   resit         scrap bought per grade, x[i,j,t] (resit_LinearProgrammingModel_assignment1 .py,
+#                 massot_6294693_part_b.py, Jochem/Resit/QML-Assignment-1-Resit-NewVar.py,
+#                 Jochem/Resit/QML-Assignment-1C-Resit-NewVar.py)
+#   assignment1c  nickel and chromium in the scrap at most what the grades need
+#                 (Jochem/Initial/QML-Assignment-1C.py)
+#   assignment1e  copper limit with electrolysis (LinearProgrammingModel_assignment1e.py,
+#                 Jochem/Initial/QML-Assignment-1E.py)
+
+from contextlib import nullcontext
+from dataclasses import replace
+
+from .electrolysis import build_electrolysis_model, set_copper_limit
+from .export import optimize
+from .matrix import build_matrix_model
+from .sensitivity import constraint_sensitivity, variable_sensitivity
+from .solution import solution, tables
+
+
+variants = {
+    'assignment1': {},
+    'assignment1c': {'balance': '<='},
+    'assignment1d': {'maxmonth': 159},
+    'resit': {'per_grade': True},
+    'assignment1e': {'electrolysis': True},
+}
+
+
+class SteelPlanningModel:
+    """Builds and solves one variant of the steel blending model for a SteelData instance.
+
+    maxmonth overrides the production capacity of the data, per_grade buys the
+    scrap per grade (x[i,j,t]), balance='<=' relaxes the nickel and chromium
+    balances to supply <= need (matrix.py) and electrolysis adds the copper limit with
+    optional electrolysis, see electrolysis.build_electrolysis_model for
+    copperLimit, formulation and linear. A profiler (instrument.Profiler)
+    records the build, optimize and results phases of every solve.
+    """
+
+    def __init__(self, data, maxmonth=None, per_grade=False, electrolysis=False,
+                 copperLimit=0.04, formulation='bigM', linear=False, env=None, profiler=None, balance='='):
+        if per_grade and electrolysis:
+            raise ValueError('electrolysis is only available with the scrap bought per month (per_grade=False)')
+        if balance != '=' and electrolysis:
+            raise ValueError("electrolysis is only available with the balances as equalities (balance='=')")
+        self.data = data if maxmonth is None else replace(data, maxmonth=maxmonth)
+        self.per_grade = per_grade
+        self.electrolysis = electrolysis
+        self.copperLimit = copperLimit
+        self.formulation = formulation
+        self.linear = linear
+        self.balance = balance
+        self.env = env
+        self.profiler = profiler
+        self.model = None
+
+    @classmethod
+    def variant(cls, name, data, **options):
+        """The model of one of the named variants, e.g. SteelPlanningModel.variant('assignment1d', data)."""
+        if name not in variants:
+            raise ValueError('unknown variant %r, expected one of %s' % (name, ', '.join(variants)))
+        return cls(data, **dict(variants[name], **options))
+
+    def _phase(self, name):
+        return self.profiler.phase(name) if self.profiler is not None else nullcontext()
+
+    def build(self):
+        """Build the Gurobi model; x, s and p (and b with electrolysis) are available afterwards."""
+        with self._phase('build'):
+            self._build()
+        return self
+
+    def _build(self):
+        if self.electrolysis:
+            self.model, self.vars = build_electrolysis_model(self.data, self.copperLimit, env=self.env,
+                                                             formulation=self.formulation, linear=self.linear)
+            self.x, self.s, self.p, self.b = self.vars['x'], self.vars['s'], self.vars['p'], self.vars['b']
+        else:
+            self.model, self.x, self.s, self.p = build_matrix_model(self.data, env=self.env, per_grade=self.per_grade,
+                                                                      balance=self.balance)
+            self.vars, self.b = None, None
+
+    def set_copper_limit(self, copperLimit):
+        """Change the copper limit of a built electrolysis model in place."""
+        set_copper_limit(self.model, self.vars, copperLimit)
+        self.copperLimit = copperLimit
+
+    def optimize(self, path=None, background=True):
+        """Solve the model (building it first if needed), optionally writing it to path during the solve."""
+        if self.model is None:
+            self.build()
+        with self._phase('optimize'):
+            optimize(self.model, path, background=background)
+        if self.profiler is not None:
+            self.profiler.solved(self.model)
+        return self.model.status
+
+    def solution(self):
+        """The solution as NumPy arrays, see solution.solution."""
+        with self._phase('results'):
+            return solution(self.model, self.x, self.s, self.p, self.b)
+
+    def tables(self):
+        """The X, S and P matrices of the solution as pandas DataFrames."""
+        with self._phase('results'):
+            return tables(self.data, self.solution())
+
+    def sensitivity(self):
+        """Shadow prices and ranging of a solved LP variant as pandas DataFrames, see sensitivity.py."""
+        with self._phase('results'):
+            return {'constraints': constraint_sensitivity(self), 'variables': variable_sensitivity(self)}
+
+    @property
+    def status(self):
+        return self.model.status
+
+    @property
+    def objVal(self):
+        return self.model.objVal
@@ -0,0 +1,150 @@
+# Presolve for LinearPrograms
+#
+# Makes the LP smaller before it is handed to a solver. Repeated until
+# nothing changes:
+#
+#   singleton rows   a row with one variable, like the supplier limit
+#                    x[i,t] <= u_i of the aggregate model, becomes a bound
+#   zero rows        an equality with right-hand side 0 whose variables are
+#                    nonnegative with coefficients of one sign forces them all
+#                    to 0, e.g. the nickel balance of a grade without nickel
+#   redundant rows   rows that hold for every value within the bounds, and
+#                    rows left without variables, are dropped
+#   fixed columns    variables with lb == ub are substituted and removed
+#
+# steel_presolve first fixes x[i,j,t] to 0 for suppliers that can never be
+# blended into grade j (per-grade model): when the grade's nickel (or
+# chromium) target is the lowest of all suppliers, no supplier with more can
+# be used, and vice versa for the highest.
+#
+# Presolved.expand maps a solution of the reduced LP back to all columns.
+#
+# Solvers with a presolve of their own (Gurobi, HiGHS) find the same
+# reductions, so on the steel LPs this gains little: within the run-to-run
+# noise of HiGHS in bench_presolve.py. It is pure overhead when nothing can
+# be removed and on small LPs, so an LP presolve cannot reduce is returned
+# as it is, and steel_presolve skips LPs under minRows rows.
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from .lp import steel_lp
+
+
+@dataclass
+class Presolved:
+    lp: object              # the reduced LinearProgram
+    original: object        # the LinearProgram before presolve
+    cols: np.ndarray        # columns of the original kept in the reduced LP
+    rows: np.ndarray        # rows of the original kept in the reduced LP
+    fixed: np.ndarray       # value of every original column that was removed (nan for kept columns)
+    offset: float           # objective contribution of the removed columns
+
+    @property
+    def removed_rows(self):
+        return self.original.A.shape[0] - len(self.rows)
+
+    @property
+    def removed_cols(self):
+        return self.original.A.shape[1] - len(self.cols)
+
+    def expand(self, x):
+        """The full solution vector of the original LP for a solution x of the reduced LP."""
+        full = self.fixed.copy()
+        full[self.cols] = x
+        return full
+
+
+def _unchanged(lp):
+    nRows, nCols = lp.A.shape
+    return Presolved(lp, lp, np.arange(nCols), np.arange(nRows), np.full(nCols, np.nan), 0.0)
+
+
+def presolve(lp, tol=1e-12, minRows=0):
+    """Reduce lp; returns a Presolved with the smaller LinearProgram and what is needed to undo it.
+
+    LPs with fewer than minRows rows, and LPs presolve cannot reduce, are
+    returned unchanged.
+    """
+    if lp.A.shape[0] < minRows:
+        return _unchanged(lp)
+    A = lp.A.tocsr().astype(float)
+    b = lp.b.astype(float).copy()
+    sense = lp.sense.copy()
+    lb, ub = lp.lb.astype(float).copy(), lp.ub.astype(float).copy()
+    live_rows = np.ones(A.shape[0], dtype=bool)
+
+    changed = True
+    while changed:
+        live_cols = lb < ub
+        # contributions of fixed columns move to the right-hand side
+        rhs = b - A @ np.where(live_cols, 0.0, lb)
+        Alive = A.copy()
+        Alive.data = Alive.data * live_cols[Alive.indices]
+        Alive.eliminate_zeros()
+        Apos, Aneg = Alive.maximum(0).tocsr(), Alive.minimum(0).tocsr()
+        npos, nneg = np.diff(Apos.indptr), np.diff(Aneg.indptr)
+        counts = npos + nneg
+        finite_lb, finite_ub = np.where(live_cols, lb, 0.0), np.where(live_cols, ub, 0.0)
+        with np.errstate(invalid='ignore'):
+            low = Apos @ finite_lb + Aneg @ finite_ub
+            high = Apos @ finite_ub + Aneg @ finite_lb
+
+        empty = live_rows & (counts == 0)
+        singleton = live_rows & (counts == 1)
+        zero = live_rows & (counts > 1) & (sense == '=') & (np.abs(rhs) <= tol) & ((npos == 0) | (nneg == 0))
+        zero &= Alive.astype(bool) @ (lb != 0) == 0
+        redundant = live_rows & ~singleton & ~zero & (((sense == '<') & (high <= rhs)) | ((sense == '>') & (low >= rhs)))
+
+        # a x <= rhs, a x == rhs or a x >= rhs as a bound on x
+        single = Alive[singleton].tocoo()
+        r, c, a = np.flatnonzero(singleton)[single.row], single.col, single.data
+        value = rhs[r] / a
+        upper = (sense[r] == '=') | ((sense[r] == '<') == (a > 0))
+        lower = (sense[r] == '=') | ~upper
+        np.minimum.at(ub, c[upper], value[upper])
+        np.maximum.at(lb, c[lower], value[lower])
+
+        ub[Alive[zero].indices] = 0
+
+        dropped = empty | singleton | zero | redundant
+        live_rows &= ~dropped
+        changed = dropped.any()
+
+    cols = np.flatnonzero(lb < ub)
+    rows = np.flatnonzero(live_rows)
+    if len(cols) == A.shape[1] and len(rows) == A.shape[0]:
+        return _unchanged(lp)
+    removed = np.flatnonzero(lb >= ub)
+    fixed = np.full(A.shape[1], np.nan)
+    fixed[removed] = lb[removed]
+
+    values = np.where(np.isnan(fixed), 0.0, fixed)
+    reduced = replace(lp, c=lp.c[cols], A=A[rows][:, cols].tocsr(), sense=sense[rows], b=(b - A @ values)[rows],
+                      lb=lb[cols], ub=ub[cols], integer=lp.integer[cols], columns={}, rows={})
+    return Presolved(reduced, lp, cols, rows, fixed, float(lp.c @ values))
+
+
+def unusable_suppliers(data):
+    """Boolean (grades x suppliers): supplier i can never be part of the blend of grade j."""
+    unusable = np.zeros((len(data.J), len(data.I)), dtype=bool)
+    for supplier, grade in ((data.nickel, data.nidist), (data.chromium, data.chdist)):
+        for j in data.J:
+            if grade[j] <= supplier.min():
+                unusable[j] |= supplier > grade[j]
+            if grade[j] >= supplier.max():
+                unusable[j] |= supplier < grade[j]
+    return unusable
+
+
+def steel_presolve(data, per_grade=False, minRows=1000):
+    """steel_lp(data, per_grade) with unusable suppliers fixed to 0, presolved if it has at least minRows rows."""
+    lp = steel_lp(data, per_grade)
+    if per_grade:
+        nI, nJ, nT = data.shape
+        mask = np.broadcast_to(unusable_suppliers(data).T[:, :, None], (nI, nJ, nT)).ravel()
+        ub = lp.ub.copy()
+        ub[:nI * nJ * nT][mask] = 0
+        lp = replace(lp, ub=ub)
+    return presolve(lp, minRows=minRows)
@@ -0,0 +1,83 @@
+# Rolling-horizon planning
+#
+# Instead of one LP over the whole horizon, solves windows of `window`
+# periods. After each window the decisions of its first `step` periods are
+# fixed, the stock at the end of those periods becomes the initial stock of
+# the next window, and the window moves on by `step` periods.
+#
+# A window does not see the demand after its last period, so the plan can
+# cost more than the full-horizon optimum. Without more, a later window can
+# even become infeasible: when the demand of a coming peak exceeds the
+# production capacity, the stock for it has to be built before the window
+# sees the peak. Each window therefore ends with a terminal stock target
+# from the demand after it: for every later period tau whose demand from
+# the end of the window on exceeds maxmonth per period,
+#
+#     sum_j max(0, demand_j(t1..tau) - s[j, t1-1]) <= maxmonth * (tau - t1 + 1)
+#
+# (with one variable per grade and tau for the max). This is exactly the
+# production capacity the later periods need; supplier limits and the
+# blending constraints are not looked ahead, so a window can still fail on
+# those and is then reported with its status.
+
+import time
+from dataclasses import replace
+
+import numpy as np
+from gurobipy import GRB
+
+from .matrix import build_matrix_model
+from .solution import solution
+
+
+def _stock_target(model, s, data, t1):
+    """Require the stock at the end of a window that ends before period t1 to cover the later demand above capacity."""
+    later = np.cumsum(data.demand[:, t1:], axis=1)
+    capacity = data.maxmonth * np.arange(1, later.shape[1] + 1)
+    # where the total later demand is within capacity, every stock satisfies the target
+    taus = np.flatnonzero(later.sum(axis=0) > capacity)
+    if taus.size == 0:
+        return
+    short = model.addMVar((later.shape[0], taus.size), lb=0, name='short')
+    model.addConstr(short >= later[:, taus] - s[:, -1:], name='shortfall')
+    model.addConstr(short.sum(axis=0) <= capacity[taus], name='stockTarget')
+
+
+def rolling_horizon(data, window, step=1, env=None, per_grade=False):
+    """Plan data with a rolling horizon; returns a dict with status, objVal, x, s, p, solves and runtime."""
+    nI, nJ, nT = data.shape
+    x = np.zeros((nI, nJ, nT) if per_grade else (nI, nT))
+    s = np.zeros((nJ, nT))
+    p = np.zeros((nJ, nT))
+    stock = data.initialstock
+    solves = 0
+    start = time.perf_counter()
+
+    t0 = 0
+    while t0 < nT:
+        t1 = min(t0 + window, nT)
+        sub = replace(data, months=data.months[t0:t1], demand=data.demand[:, t0:t1], initialstock=stock)
+        model, xw, sw, pw = build_matrix_model(sub, env=env, per_grade=per_grade)
+        _stock_target(model, sw, data, t1)
+        model.optimize()
+        solves += 1
+        if model.status != GRB.OPTIMAL:
+            status = model.status
+            model.dispose()
+            return {'status': status, 'objVal': np.nan, 'failedPeriod': t0, 'solves': solves,
+                    'runtime': time.perf_counter() - start}
+
+        # fix the first periods of the window and carry their end stock forward
+        k = min(step, t1 - t0)
+        sol = solution(model, xw, sw, pw)
+        x[..., t0:t0 + k] = sol['x'][..., :k]
+        s[:, t0:t0 + k] = sol['s'][:, :k]
+        p[:, t0:t0 + k] = sol['p'][:, :k]
+        stock = sol['s'][:, k - 1]
+        model.dispose()
+        t0 += k
+
+    supply = x.sum(axis=1) if per_grade else x
+    objVal = float(data.cost @ supply.sum(axis=1) + data.holdingcosts @ s.sum(axis=1))
+    return {'status': GRB.OPTIMAL, 'objVal': objVal, 'x': x, 's': s, 'p': p, 'solves': solves,
+            'runtime': time.perf_counter() - start}
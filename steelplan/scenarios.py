@@ -0,0 +1,87 @@
+# Demand scenario batches
+#
+# Solves the StainlessSteelProduction LP for many demand matrices in parallel.
+# Every worker process holds its own Gurobi environment with Threads capped,
+# so workers x threads never exceeds the number of cores. The results of all
+# scenarios are collected in one table.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+from gurobipy import GRB, Env
+
+from .demand import load_demand
+from .matrix import build_matrix_model
+from .solution import solution
+
+
+def test_scenarios(data, seed=None):
+    """The demand tests of LinearProgrammingModel_assignment1.py ("test 0" ... "test 5") as (name, demand) pairs."""
+    nJ, nT = data.demand.shape
+    single = np.zeros((nJ, nT))
+    single[:, 0] = 10
+    last = np.zeros((nJ, nT))
+    last[:, -1] = 250
+    peak = data.demand.copy()
+    peak[:, 0] = 100
+    only_last_grade = np.zeros((nJ, nT))
+    only_last_grade[-1] = 1
+
+    yield 'base', data.demand
+    yield 'test 0', single
+    yield 'test 1', only_last_grade
+    yield 'test 2', peak
+    yield 'test 3', last
+    yield 'test 4', np.zeros((nJ, nT))
+    yield 'test 5', np.random.default_rng(seed).integers(0, 50, size=(nJ, nT))
+
+
+def load_scenarios(directory):
+    """Read every .npy, .csv or .parquet demand file in a directory (see demand.load_demand) as (name, demand) pairs."""
+    for filename in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(filename)
+        if ext in ('.npy', '.csv', '.parquet'):
+            yield name, load_demand(os.path.join(directory, filename))[0]
+
+
+# ---- Worker ----
+
+_env = None
+
+
+def _init_worker(threads):
+    global _env
+    _env = Env(params={'OutputFlag': 0, 'Threads': threads})
+
+
+def _solve_scenario(data, name, demand):
+    model, x, s, p = build_matrix_model(replace(data, demand=demand), env=_env)
+    model.optimize()
+
+    result = {'scenario': name, 'status': model.status, 'runtime': model.Runtime,
+              'objVal': np.nan, 'x': None, 's': None, 'p': None}
+    if model.status == GRB.OPTIMAL:
+        sol = solution(model, x, s, p)
+        result.update(objVal=model.objVal, x=sol['x'], s=sol['s'], p=sol['p'])
+    model.dispose()
+    return result
+
+
+def run_scenarios(data, scenarios, workers=None, threads=None):
+    """Solve data for every (name, demand) scenario across a process pool; returns one row per scenario."""
+    workers = workers or os.cpu_count()
+    threads = threads or max(1, os.cpu_count() // workers)
+
+    scenarios = [(name, np.asarray(demand, dtype=float)) for name, demand in scenarios]
+    for name, demand in scenarios:
+        if demand.shape != data.demand.shape:
+            raise ValueError('scenario %r has demand of shape %s, the data has %s' % (name, demand.shape, data.demand.shape))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(threads,)) as pool:
+        futures = [pool.submit(_solve_scenario, data, name, demand) for name, demand in scenarios]
+        rows = [future.result() for future in futures]
+
+    return pd.DataFrame(rows, columns=['scenario', 'status', 'objVal', 'runtime', 'x', 's', 'p'])
@@ -0,0 +1,80 @@
+# Sensitivity analysis of the LP variants
+#
+# One solve of the LP already holds the answer to many what-if questions:
+#
+#   Pi                  change of the cost per unit more right-hand side
+#   SARHSLow, SARHSUp   range of the right-hand side in which Pi stays valid
+#   SAObjLow, SAObjUp   range of an objective coefficient in which the plan
+#                       stays optimal
+#
+# E.g. the Pi of the capacity rows con3 and their SARHSUp tell what raising
+# maxmonth from 100 towards 159 (assignment1d) saves without re-solving.
+# The tables are tidy: one row per constraint or variable, labelled by
+# supplier, grade and month.
+
+import numpy as np
+
+
+families = {
+    'con1': 'supplier limit',
+    'con2': 'demand',
+    'con3': 'capacity',
+}
+
+
+def _labels(data, family, n, per_grade=False):
+    """Supplier, grade and month labels of the n rows of a constraint family or variable."""
+    suppliers = list(data.suppliername)
+    grades = ['Steel_%d' % j for j in data.J]
+    months = list(data.months)
+    nI, nJ, nT = data.shape
+    none = [None] * n
+    if family in ('con1', 'x') and not (family == 'x' and per_grade):
+        return [suppliers[k // nT] for k in range(n)], none, [months[k % nT] for k in range(n)]
+    if family == 'x':
+        return ([suppliers[k // (nJ * nT)] for k in range(n)], [grades[k // nT % nJ] for k in range(n)],
+                [months[k % nT] for k in range(n)])
+    if family in ('con2', 's', 'p'):
+        return none, [grades[k // nT] for k in range(n)], [months[k % nT] for k in range(n)]
+    return none, none, [months[k] for k in range(n)]
+
+
+def constraint_sensitivity(model):
+    """Pi and right-hand side ranging of the supplier-limit, demand and capacity rows of a solved LP SteelPlanningModel."""
+    import pandas as pd
+
+    m = _lp(model)
+    constrs = m.getConstrs()
+    names = np.array(m.getAttr('ConstrName', constrs))
+    attrs = ('RHS', 'Slack', 'Pi', 'SARHSLow', 'SARHSUp')
+    values = {attr: np.array(m.getAttr(attr, constrs)) for attr in attrs}
+    frames = []
+    for family, description in families.items():
+        rows = np.flatnonzero(np.char.startswith(names.astype(str), family + '['))
+        supplier, grade, month = _labels(model.data, family, len(rows))
+        frames.append(pd.DataFrame(dict({'constraint': family, 'description': description, 'supplier': supplier,
+                                         'grade': grade, 'month': month},
+                                        **{attr: values[attr][rows] for attr in attrs})))
+    return pd.concat(frames, ignore_index=True)
+
+
+def variable_sensitivity(model):
+    """Reduced costs and objective ranging of x, s and p of a solved LP SteelPlanningModel."""
+    import pandas as pd
+
+    _lp(model)
+    attrs = ('X', 'Obj', 'RC', 'SAObjLow', 'SAObjUp')
+    frames = []
+    for family, var in (('x', model.x), ('s', model.s), ('p', model.p)):
+        values = {attr: np.ravel(var.getAttr(attr)) for attr in attrs}
+        supplier, grade, month = _labels(model.data, family, len(values['X']), model.per_grade)
+        frames.append(pd.DataFrame(dict({'variable': family, 'supplier': supplier, 'grade': grade, 'month': month},
+                                        **values)))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _lp(model):
+    m = model.model
+    if m is None or m.IsMIP:
+        raise ValueError('sensitivity information is only available for a solved LP variant (not electrolysis)')
+    return m
@@ -0,0 +1,247 @@
+# Local solve service
+#
+# An HTTP service on 127.0.0.1 around the steel and cargo models, for other
+# systems that should not shell out to the scripts:
+#
+#     POST /solve    a request as for worker.py, answered with the same JSON
+#     GET  /health   queue length and counters
+#
+# Requests wait in a bounded queue; when it is full the service answers 429
+# (Too Many Requests) right away instead of letting latency grow. `workers`
+# threads, each with its own Env from an EnvPool, take requests from the
+# queue, so at most `workers` solves run at once (default: one per core).
+#
+# A worker takes up to `batch` waiting requests (waiting at most `wait`
+# seconds for more). LP requests of the same model, options and size are
+# merged into one block-diagonal LP (lp.merge) and solved by one Gurobi call;
+# if that merged LP fails or is not optimal, its requests are solved one by
+# one. Electrolysis (MIP) requests are always solved alone. A request that
+# is not answered within `timeout` seconds gets a 504 and is cancelled, so
+# a worker that has not started it yet skips it; an unexpected error in a
+# worker is answered with a 500 instead of stopping the worker.
+#
+#     python -m steelplan.service [--port 8350] [--workers N] [--queue 64] [--batch 8] [--wait 0.002] [--timeout 60]
+
+import argparse
+import concurrent.futures
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gurobipy import GRB
+
+from .backends import solve_gurobi
+from .lp import cargo_lp, merge, steel_lp
+from .worker import EnvPool, instance, solve_request
+
+
+def _batch_key(request):
+    """Requests with the same key can be merged into one LP; None for requests that cannot."""
+    kind = request.get('model', 'steel')
+    options = request.get('options', {})
+    if kind == 'cargo' and not options:
+        data = instance('cargo', request.get('data'))
+        return ('cargo', data.shape)
+    if kind == 'steel' and not options.get('electrolysis') and set(options) <= {'electrolysis', 'per_grade', 'maxmonth'}:
+        data = instance('steel', request.get('data'))
+        return ('steel', bool(options.get('per_grade')), data.shape)
+    return None
+
+
+def _lp(request):
+    options = request.get('options', {})
+    data = instance(request.get('model', 'steel'), request.get('data'))
+    if request.get('model', 'steel') == 'cargo':
+        return cargo_lp(data)
+    if options.get('maxmonth') is not None:
+        data = replace(data, maxmonth=options['maxmonth'])
+    return steel_lp(data, bool(options.get('per_grade')))
+
+
+def _answer(lp, values):
+    sol = lp.split(values)
+    if 'p' in sol:
+        sol['supply'] = sol['x'].sum(axis=1) if sol['x'].ndim == 3 else sol['x']
+    return {'status': GRB.OPTIMAL, 'objVal': float(lp.c @ values), 'solution': {name: value.tolist() for name, value in sol.items()}}
+
+
+class SolveService:
+    """Bounded request queue served by `workers` threads with one Env each, merging small LPs into batches."""
+
+    def __init__(self, workers=None, queueSize=64, batch=8, wait=0.002, timeout=60.0):
+        self.workers = workers or os.cpu_count()
+        self.batch = batch
+        self.wait = wait
+        self.timeout = timeout
+        self.queue = queue.Queue(maxsize=queueSize)
+        self.pool = EnvPool(self.workers)
+        self.counts = {'solved': 0, 'rejected': 0, 'cancelled': 0, 'batches': 0, 'merged': 0}
+        self.lock = threading.Lock()
+        self.threads = [threading.Thread(target=self._work, daemon=True) for _ in range(self.workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, request):
+        """Queue a request; returns a Future of the answer, raises queue.Full when the queue is full."""
+        future = Future()
+        try:
+            self.queue.put_nowait((request, future))
+        except queue.Full:
+            with self.lock:
+                self.counts['rejected'] += 1
+            raise
+        return future
+
+    def _take(self):
+        items = [self.queue.get()]
+        deadline = time.perf_counter() + self.wait
+        while len(items) < self.batch:
+            try:
+                items.append(self.queue.get(timeout=max(0.0, deadline - time.perf_counter())))
+            except queue.Empty:
+                break
+        return items
+
+    def _work(self):
+        while True:
+            taken = self._take()
+            # a request whose caller timed out was cancelled; the others are marked running
+            items = [(request, future) for request, future in taken if future.set_running_or_notify_cancel()]
+            if len(items) < len(taken):
+                with self.lock:
+                    self.counts['cancelled'] += len(taken) - len(items)
+            if not items:
+                continue
+            groups = {}
+            for request, future in items:
+                try:
+                    key = _batch_key(request)
+                except Exception:
+                    key = None
+                groups.setdefault(key if key is not None else id(future), []).append((request, future))
+            try:
+                with self.pool.env() as env:
+                    for group in groups.values():
+                        self._solve(group, env)
+            except Exception as error:
+                # never leave a caller waiting on a future that no worker will resolve
+                for request, future in items:
+                    if not future.done():
+                        future.set_exception(error)
+            with self.lock:
+                self.counts['solved'] += len(items)
+                self.counts['batches'] += 1
+
+    def _solve(self, group, env):
+        if len(group) > 1:
+            try:
+                lps = [_lp(request) for request, _ in group]
+                merged, offsets = merge(lps)
+                result = solve_gurobi(merged, env)
+            except Exception:       # e.g. the merged LP exceeds a size-limited licence
+                result = None
+            if result is not None and result.status == 'optimal':
+                for (request, future), lp, offset in zip(group, lps, offsets):
+                    future.set_result(dict(_answer(lp, result.x[offset:offset + len(lp.c)]), id=request.get('id')))
+                with self.lock:
+                    self.counts['merged'] += len(group)
+                return
+        for request, future in group:
+            answer = {'id': request.get('id')}
+            try:
+                answer.update(solve_request(request, env))
+            except Exception as error:
+                answer['error'] = '%s: %s' % (type(error).__name__, error)
+            future.set_result(answer)
+
+    def health(self):
+        with self.lock:
+            return dict(self.counts, queued=self.queue.qsize(), workers=self.workers)
+
+
+def make_server(service, port=8350):
+    """A ThreadingHTTPServer on 127.0.0.1:port answering /solve and /health from service."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code, body, headers=()):
+            payload = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in headers:
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send(200, service.health())
+            else:
+                self._send(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if self.path != '/solve':
+                self._send(404, {'error': 'not found'})
+                return
+            start = time.perf_counter()
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            except ValueError as error:
+                self._send(400, {'error': 'invalid JSON: %s' % error})
+                return
+            if not isinstance(request, dict):
+                self._send(400, {'error': 'a request must be a JSON object, got %s' % type(request).__name__})
+                return
+            try:
+                future = service.submit(request)
+            except queue.Full:
+                self._send(429, {'id': request.get('id'), 'error': 'queue full'}, [('Retry-After', '1')])
+                return
+            try:
+                answer = future.result(timeout=service.timeout)
+            except concurrent.futures.TimeoutError:
+                future.cancel()         # not solved any more if no worker has taken it yet
+                self._send(504, {'id': request.get('id'), 'error': 'no answer within %g s' % service.timeout})
+                return
+            except Exception as error:
+                self._send(500, {'id': request.get('id'), 'error': '%s: %s' % (type(error).__name__, error)})
+                return
+            answer['latency'] = time.perf_counter() - start
+            self._send(200 if 'error' not in answer else 400, answer)
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128        # pending connections; back-pressure is the 429 of the solve queue
+
+    server = Server(('127.0.0.1', port), Handler)
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve steel and cargo solves over HTTP on 127.0.0.1.')
+    parser.add_argument('--port', type=int, default=8350)
+    parser.add_argument('--workers', type=int, help='parallel solves (default: number of cores)')
+    parser.add_argument('--queue', type=int, default=64, help='waiting requests before answering 429')
+    parser.add_argument('--batch', type=int, default=8, help='requests merged into one solve at most')
+    parser.add_argument('--wait', type=float, default=0.002, help='seconds to wait for more requests to batch')
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds before a request is answered with 504')
+    args = parser.parse_args()
+
+    service = SolveService(args.workers, args.queue, args.batch, args.wait, args.timeout)
+    server = make_server(service, args.port)
+    print('serving on http://127.0.0.1:%d' % args.port, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.pool.close()
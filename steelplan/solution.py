@@ -0,0 +1,42 @@
+# Solution extraction
+#
+# Reads the solution with one getAttr call per variable family instead of one
+# .x access per variable, and returns it as NumPy arrays: x (suppliers x
+# months, or suppliers x grades x months for per-grade blending), s and p
+# (grades x months) and b (months). The pandas tables are built from those
+# arrays.
+
+import numpy as np
+
+
+def values(model, vars, attr='X'):
+    """attr of a dict of Vars keyed by index tuples (or of an MVar) as an array indexed the same way."""
+    if not isinstance(vars, dict):
+        return vars.getAttr(attr)
+    keys = list(vars)
+    vals = np.asarray(model.getAttr(attr, list(vars.values())))
+    index = np.array(keys).reshape(len(keys), -1)
+    out = np.zeros(tuple(index.max(axis=0) + 1))
+    out[tuple(index.T)] = vals
+    return out
+
+
+def solution(model, x, s, p, b=None):
+    """The solution as a dict of arrays: x, s, p, b (None without electrolysis) and supply, x summed per supplier and month."""
+    sol = {'x': values(model, x), 's': values(model, s), 'p': values(model, p), 'b': None}
+    if b is not None:
+        sol['b'] = np.rint(values(model, b)).astype(int)
+    sol['supply'] = sol['x'].sum(axis=1) if sol['x'].ndim == 3 else sol['x']
+    return sol
+
+
+def tables(data, sol):
+    """X (alloy supply), S (storage) and P (production) matrices as pandas DataFrames."""
+    import pandas as pd
+
+    grades = ['Steel_%d' % j for j in data.J]
+    return {
+        'x': pd.DataFrame(sol['supply'], index=list(data.suppliername), columns=data.months),
+        's': pd.DataFrame(sol['s'], index=grades, columns=data.months),
+        'p': pd.DataFrame(sol['p'], index=grades, columns=data.months),
+    }
@@ -0,0 +1,233 @@
+# Two-stage stochastic demand planning
+#
+# The scrap purchases x[i,t] are decided before demand is known; production
+# p, stock s and lost sales per demand scenario adapt afterwards:
+#
+#   first stage    min  cost x + E[Q(x, d)],   x[i,t] <= maxpermonth[i]
+#   second stage   Q(x, d) = min holding s + shortageCost * short
+#                  s.t. u[i,t] <= x[i,t]                    (use at most the scrap bought)
+#                       p[j,t] + s[j,t-1] + short[j,t] = d[j,t] + s[j,t]
+#                       capacity, nickel, chromium and mass balances on u and p
+#
+# Scrap that is bought but not needed is lost, and demand that cannot be met
+# is lost at shortageCost per kg, so every x has a feasible second stage.
+#
+# The expectation is replaced by the average over sampled demands (sample
+# average approximation, sample_demands). l_shaped solves that problem by
+# Benders decomposition: the master holds x and theta, the scenario
+# subproblems are solved in a process pool for the master's x, and their
+# duals of u <= x give the cut theta >= Q(x_k) + g'(x - x_k). The master
+# only looks in a box around the best x so far (trust region), which keeps
+# the iterates from jumping between corners of the cut model, and the
+# second stage at the mean demand is part of the master as a first lower
+# bound. By default there is one theta and one cut per scenario (multicut);
+# multicut=False adds one averaged cut per iteration, which needs many more
+# iterations. extensive_form solves the same problem as one LP.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import scipy.sparse as sp
+from gurobipy import GRB, Env, Model
+
+from .matrix import constraint_blocks
+
+
+def sample_demands(data, scenarios, seed=0, cv=0.2):
+    """scenarios demand matrices: the demand of data times lognormal noise with coefficient of variation cv."""
+    rng = np.random.default_rng(seed)
+    sigma = np.sqrt(np.log(1 + cv ** 2))
+    noise = rng.lognormal(-sigma ** 2 / 2, sigma, size=(scenarios,) + data.demand.shape)
+    return data.demand * noise
+
+
+def _shortage(data, shortageCost):
+    return 10 * data.cost.max() if shortageCost is None else shortageCost
+
+
+def second_stage_blocks(data, demand, shortageCost=None):
+    """(A, sense, b, c) of the second stage over the columns [u, s, p, short]; the first nI*nT rows are u <= x (b = 0)."""
+    nI, nJ, nT = data.shape
+    blocks = constraint_blocks(replace(data, demand=demand))
+    nX, nJT = nI * nT, nJ * nT
+    con2 = blocks['con2']
+    rows = [
+        (sp.hstack([sp.identity(nX), sp.csr_matrix((nX, 2 * nJT + nJT))]), GRB.LESS_EQUAL, np.zeros(nX)),
+        (sp.hstack([con2[0], sp.identity(nJT)]), con2[1], con2[2]),
+    ] + [(sp.hstack([blocks[name][0], sp.csr_matrix((blocks[name][0].shape[0], nJT))]), blocks[name][1], blocks[name][2])
+         for name in ('con3', 'con4', 'con5', 'con6')]
+    A = sp.vstack([A for A, _, _ in rows], format='csr')
+    sense = np.concatenate([np.full(A.shape[0], s) for A, s, _ in rows])
+    b = np.concatenate([b for _, _, b in rows]).astype(float)
+    c = np.concatenate([np.zeros(nX), np.repeat(data.holdingcosts, nT), np.zeros(nJT), np.full(nJT, _shortage(data, shortageCost))])
+    return A, sense, b, c
+
+
+# ---- Scenario workers ----
+
+_env = None
+_subproblems = {}
+
+
+def _init_worker(threads=1):
+    global _env
+    _close_worker()
+    _env = Env(params={'OutputFlag': 0, 'Threads': threads})
+
+
+def _close_worker():
+    """Dispose the subproblem models and the Env of this process."""
+    global _env
+    for model, _ in _subproblems.values():
+        model.dispose()
+    _subproblems.clear()
+    if _env is not None:
+        _env.dispose()
+        _env = None
+
+
+def _subproblem(data, k, demand, shortageCost):
+    """The second-stage model of scenario k, built on first use and kept for later iterations."""
+    if k not in _subproblems:
+        A, sense, b, c = second_stage_blocks(data, demand, shortageCost)
+        model = Model('StainlessSteelProductionScenario', env=_env)
+        y = model.addMVar(len(c), lb=0, obj=c)
+        rows = model.addMConstr(A, y, sense, b)
+        model.update()
+        nX = len(data.I) * len(data.T)
+        _subproblems[k] = (model, rows.tolist()[:nX])
+    return _subproblems[k]
+
+
+def _solve_scenarios(data, ks, demands, xbar, shortageCost):
+    """Q and the gradient dQ/dx (duals of u <= x) of scenarios ks at first stage xbar."""
+    out = []
+    for k, demand in zip(ks, demands):
+        model, link = _subproblem(data, k, demand, shortageCost)
+        model.setAttr('RHS', link, xbar.tolist())
+        model.optimize()
+        if model.status != GRB.OPTIMAL:
+            raise RuntimeError('scenario %d: second stage not solved (status %d)' % (k, model.status))
+        out.append((model.objVal, np.array(model.getAttr('Pi', link))))
+    return out
+
+
+def l_shaped(data, demands, shortageCost=None, workers=None, multicut=True, tol=1e-6, maxiter=500, env=None):
+    """Solve the two-stage SAA problem over demands by the L-shaped method; returns a dict with status, objVal, x, iterations and runtime."""
+    start = time.perf_counter()
+    nI, nJ, nT = data.shape
+    demands = np.asarray(demands, dtype=float)
+    nS, nX = len(demands), nI * nT
+    workers = workers or os.cpu_count()
+
+    master = Model('StainlessSteelProductionMaster', env=env)
+    x = master.addMVar(nX, lb=0, ub=np.repeat(data.maxpermonth, nT), obj=np.repeat(data.cost, nT), name='X')
+    theta = master.addMVar(nS if multicut else 1, lb=0, obj=1 / nS if multicut else 1, name='theta')
+    master.modelSense = GRB.MINIMIZE
+
+    # the second stage at the mean demand is a lower bound on the mean second-stage
+    # cost (Q is convex in the demand), so it goes into the master as a valid first cut
+    A, sense, b, c = second_stage_blocks(data, np.mean(demands, axis=0), shortageCost)
+    y = master.addMVar(len(c), lb=0, name='Ymean')
+    master.addMConstr(A[nX:], y, sense[nX:], b[nX:])
+    master.addConstr(y[:nX] - x <= 0)
+    master.addConstr(theta.sum() / (nS if multicut else 1) >= c @ y)
+
+    # scenarios in one chunk per worker; in-process when there is a single worker
+    chunks = [range(w, nS, workers) for w in range(workers)]
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) if workers > 1 else None
+    if pool is None:
+        _init_worker()
+
+    # box trust region around the best x so far: plain L-shaped (Kelley) cuts zig-zag for a long time
+    upperBound = np.repeat(data.maxpermonth, nT).astype(float)
+    radius = 0.25 * upperBound.max()
+    center = None
+
+    try:
+        best, iterations, status = np.inf, 0, GRB.OPTIMAL
+        while iterations < maxiter:
+            if center is not None:
+                x.LB = np.maximum(0, center - radius)
+                x.UB = np.minimum(upperBound, center + radius)
+            master.optimize()
+            iterations += 1
+            if master.status != GRB.OPTIMAL:
+                status = master.status
+                break
+            xbar, lower = x.X, master.objVal
+
+            if pool is None:
+                results = _solve_scenarios(data, range(nS), demands, xbar, shortageCost)
+            else:
+                futures = [pool.submit(_solve_scenarios, data, list(ks), demands[list(ks)], xbar, shortageCost) for ks in chunks]
+                parts = [future.result() for future in futures]
+                results = [None] * nS
+                for ks, part in zip(chunks, parts):
+                    for k, result in zip(ks, part):
+                        results[k] = result
+            Q = np.array([q for q, _ in results])
+            G = np.array([g for _, g in results])
+            upper = float(np.repeat(data.cost, nT) @ xbar + Q.mean())
+
+            if center is not None and best - lower <= tol * max(1.0, abs(best)):
+                # converged within the box; the box is only a restriction, so check the whole range
+                x.LB, x.UB = 0, upperBound
+                master.optimize()
+                if best - master.objVal <= tol * max(1.0, abs(best)):
+                    break
+                radius = min(2 * radius, upperBound.max())
+            if upper < best - 1e-4 * (best - lower) or center is None:
+                # serious step: move the box, and widen it when the model predicted the decrease well
+                if center is not None and upper <= best - 0.5 * (best - lower):
+                    radius = min(2 * radius, upperBound.max())
+                best, center = upper, xbar
+
+            if multicut:
+                for k in range(nS):
+                    master.addConstr(theta[k] >= Q[k] + G[k] @ (x - xbar))
+            else:
+                g = G.mean(axis=0)
+                master.addConstr(theta[0] >= Q.mean() + g @ (x - xbar))
+        else:
+            status = GRB.ITERATION_LIMIT
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        else:
+            _close_worker()
+        master.dispose()
+
+    result = {'status': status, 'iterations': iterations, 'runtime': time.perf_counter() - start}
+    if status == GRB.OPTIMAL:
+        result.update(objVal=best, x=center.reshape(nI, nT))
+    else:
+        result.update(objVal=np.nan)
+    return result
+
+
+def extensive_form(data, demands, shortageCost=None, env=None):
+    """The two-stage SAA problem over demands as one LP; returns a dict with status, objVal, x and runtime."""
+    start = time.perf_counter()
+    nI, nJ, nT = data.shape
+    nS, nX = len(demands), nI * nT
+
+    model = Model('StainlessSteelProductionSAA', env=env)
+    x = model.addMVar(nX, lb=0, ub=np.repeat(data.maxpermonth, nT), obj=np.repeat(data.cost, nT), name='X')
+    for k, demand in enumerate(demands):
+        A, sense, b, c = second_stage_blocks(data, demand, shortageCost)
+        y = model.addMVar(len(c), lb=0, obj=c / nS, name='Y%d' % k)
+        # the first rows of A are u <= x with x moved to the right-hand side, here x is a variable
+        model.addMConstr(A[nX:], y, sense[nX:], b[nX:])
+        model.addConstr(y[:nX] - x <= 0)
+    model.modelSense = GRB.MINIMIZE
+    model.optimize()
+
+    result = {'status': model.status, 'runtime': time.perf_counter() - start, 'objVal': np.nan}
+    if model.status == GRB.OPTIMAL:
+        result.update(objVal=model.objVal, x=x.X.reshape(nI, nT))
+    model.dispose()
+    return result
@@ -0,0 +1,52 @@
+# Copper-limit sweep
+#
+# Solves the electrolysis MIP for a series of copper limits. The model is built
+# once; for every new limit only the con7 coefficients change and the previous
+# solution is passed as MIP start, so each step is a warm re-solve instead of
+# a rebuild.
+#
+# The default formulation is 'tightM'. With the 1e9 big M of the script, a
+# binary within its integrality tolerance of 0 (b[t] = 1e-6) still lifts con7
+# by 1000, so the previous solution passes as a feasible start for a lower
+# limit that it actually violates, and Gurobi reports its cost as optimal.
+# 'bigM' is therefore solved without MIP start.
+
+from gurobipy import GRB
+
+from .electrolysis import build_electrolysis_model, set_copper_limit
+from .solution import solution
+
+
+def solve_limit(model, vars, data, copperLimit):
+    """Re-solve a built electrolysis model at copperLimit, warm-started from its last solution; returns a result dict."""
+    set_copper_limit(model, vars, copperLimit)
+    model.optimize()
+
+    result = {'copperLimit': copperLimit, 'status': model.status, 'runtime': model.Runtime}
+    if model.status == GRB.OPTIMAL:
+        result['objVal'] = model.objVal
+        sol = solution(model, vars['x'], vars['s'], vars['p'], vars['b'])
+        result['electrolysis'] = [int(value) for value in sol['b']]
+        result['electrolysisCost'] = list(data.electrolysisFixedCost + data.electrolysisVariableCost * (data.copper @ sol['x']))
+        # warm start the next limit from this incumbent (not with big M, see above)
+        if vars['formulation'] != 'bigM':
+            allVars = model.getVars()
+            model.setAttr('Start', allVars, model.getAttr('X', allVars))
+    return result
+
+
+def copper_sweep(data, limits, env=None, stop_at_infeasible=True, formulation='tightM', linear=False):
+    """Solve the electrolysis model for each copper limit; returns one result dict per solved limit."""
+    limits = list(limits)
+    model, vars = build_electrolysis_model(data, limits[0], env=env, formulation=formulation, linear=linear)
+    model.setParam('MIPGap', 0)
+
+    results = []
+    for copperLimit in limits:
+        result = solve_limit(model, vars, data, copperLimit)
+        results.append(result)
+
+        if result['status'] != GRB.OPTIMAL and stop_at_infeasible:
+            break
+
+    return results
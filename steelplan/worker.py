@@ -0,0 +1,174 @@
+# Long-lived solve worker
+#
+# Starting a script costs more than solving a small re-plan: the interpreter
+# imports gurobipy, checks out a licence for a new Env and only then builds
+# the model. The worker pays that once. It keeps a pool of started Envs and
+# answers requests, one JSON object per line, on stdin/stdout or on a Unix
+# socket:
+#
+#     {"id": 1, "model": "steel", "data": {"maxmonth": 159}, "options": {"per_grade": true}}
+#     {"id": 2, "model": "cargo", "data": {"cargoquantity": [20, 12, 30, 11]}}
+#
+# "data" overrides fields of default_data() or default_cargo(), "options"
+# are SteelPlanningModel options. The answer holds status, objVal, the
+# solution arrays and the time spent in the worker. The first line the
+# worker writes is {"ready": true, "startup": seconds}, with the time it
+# took to start the Envs.
+#
+#     python -m steelplan.worker [--envs 4] [--socket /tmp/steelplan.sock]
+
+import argparse
+import json
+import os
+import queue
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import fields, replace
+
+import numpy as np
+from gurobipy import GRB, Env
+
+from .cargo import build_cargo_model, default_cargo
+from .data import default_data
+from .model import SteelPlanningModel
+from .solution import values
+
+
+class EnvPool:
+    """size started Gurobi environments, lent out one at a time."""
+
+    def __init__(self, size=1, **params):
+        self.envs = queue.Queue()
+        for _ in range(size):
+            self.envs.put(Env(params=dict({'OutputFlag': 0, 'Threads': 1}, **params)))
+
+    @contextmanager
+    def env(self):
+        env = self.envs.get()
+        try:
+            yield env
+        finally:
+            self.envs.put(env)
+
+    def close(self):
+        while not self.envs.empty():
+            self.envs.get().dispose()
+
+
+def instance(kind, overrides=None):
+    """default_data() or default_cargo() with the fields in overrides replaced."""
+    base = {'steel': default_data, 'cargo': default_cargo}[kind]()
+    names = {field.name for field in fields(base)}
+    overrides = overrides or {}
+    unknown = set(overrides) - names
+    if unknown:
+        raise ValueError('unknown %s data fields: %s' % (kind, ', '.join(sorted(unknown))))
+    return replace(base, **{name: value if isinstance(value, (int, float)) else np.asarray(value)
+                            for name, value in overrides.items()})
+
+
+def _tolist(value):
+    return value.tolist() if isinstance(value, np.ndarray) else value
+
+
+def solve_request(request, env):
+    """Solve one request dict with env; returns the answer dict."""
+    kind = request.get('model', 'steel')
+    if kind not in ('steel', 'cargo'):
+        raise ValueError("unknown model %r, expected 'steel' or 'cargo'" % kind)
+    data = instance(kind, request.get('data'))
+    if kind == 'cargo':
+        model, x = build_cargo_model(data, env=env)
+        model.optimize()
+        sol = {'x': values(model, x)} if model.status == GRB.OPTIMAL else {}
+    else:
+        spm = SteelPlanningModel(data, env=env, **request.get('options', {}))
+        spm.optimize(background=False)
+        model = spm.model
+        sol = spm.solution() if model.status == GRB.OPTIMAL else {}
+    answer = {'status': model.status, 'objVal': model.objVal if model.status == GRB.OPTIMAL else None,
+              'solution': {name: _tolist(value) for name, value in sol.items() if value is not None}}
+    model.dispose()
+    return answer
+
+
+def handle(line, pool):
+    """Parse, solve and answer one request line; errors are answered, not raised."""
+    start = time.perf_counter()
+    try:
+        request = json.loads(line)
+    except ValueError as error:
+        return {'id': None, 'error': 'invalid JSON: %s' % error}
+    if not isinstance(request, dict):
+        return {'id': None, 'error': 'a request must be a JSON object, got %s' % type(request).__name__}
+    answer = {'id': request.get('id')}
+    try:
+        with pool.env() as env:
+            answer.update(solve_request(request, env))
+    except Exception as error:
+        answer['error'] = '%s: %s' % (type(error).__name__, error)
+    answer['latency'] = time.perf_counter() - start
+    return answer
+
+
+def serve_stdin(pool, workers, infile=sys.stdin, outfile=sys.stdout):
+    """Answer request lines from infile on outfile until EOF; up to workers requests are solved at once."""
+    lock = threading.Lock()
+
+    def respond(line):
+        answer = json.dumps(handle(line, pool))
+        with lock:
+            outfile.write(answer + '\n')
+            outfile.flush()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for line in infile:
+            if line.strip():
+                executor.submit(respond, line)
+
+
+def serve_socket(pool, path):
+    """Answer request lines on every connection to the Unix socket path until interrupted."""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if line.strip():
+                    self.wfile.write(json.dumps(handle(line, pool)).encode() + b'\n')
+                    self.wfile.flush()
+
+    if os.path.exists(path):
+        os.remove(path)
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve steel and cargo solves from a pool of Gurobi environments.')
+    parser.add_argument('--envs', type=int, default=1, help='number of environments, i.e. parallel solves')
+    parser.add_argument('--socket', help='listen on this Unix socket instead of stdin/stdout')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pool = EnvPool(args.envs)
+    ready = json.dumps({'ready': True, 'startup': time.perf_counter() - start})
+    try:
+        if args.socket:
+            print(ready, flush=True)
+            serve_socket(pool, args.socket)
+        else:
+            sys.stdout.write(ready + '\n')
+            sys.stdout.flush()
+            serve_stdin(pool, args.envs)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.close()